@@ -13,13 +13,56 @@ Key features:
 - Metric data parsing
 """
 
+import re
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests_aws4auth import AWS4Auth
 from botocore.session import Session
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Tuple
 from logger import logger
 from utils import handle_exceptions
 
+# Upper bound on in-flight queries; also the size of the HTTP connection pool
+MAX_CONCURRENT_QUERIES = 16
+
+# Deployments per batched container discovery query, keeps the GET URL well below server limits
+CONTAINER_QUERY_BATCH_SIZE = 50
+
+# Shared botocore session; resolving config files and the credential chain is not free
+_BOTO_SESSION = Session()
+
+
+def escape_promql_regex(value: str) -> str:
+    """Escape a literal (e.g. a deployment name) for a double-quoted PromQL regex matcher."""
+    return re.escape(value).replace("\\", "\\\\")
+
+
+@lru_cache(maxsize=1024)
+def pod_selector(deployments: Tuple[str, ...]) -> str:
+    """
+    PromQL regex (for a pod=~"..." matcher) selecting the pods of the deployments.
+
+    Built once per deployment set and reused across queries, so the same
+    deployments always produce the identical matcher string.
+    """
+    alternatives = "|".join(map(escape_promql_regex, deployments))
+    if len(deployments) > 1:
+        alternatives = f"({alternatives})"
+    return f"{alternatives}-[a-z0-9]+-[a-z0-9]+"
+
+
+@lru_cache(maxsize=256)
+def _pod_regex(deployments: Tuple[str, ...]) -> re.Pattern:
+    """Compiled pattern matching pods of any of the deployments, capturing the deployment name."""
+    alternatives = "|".join(map(re.escape, deployments))
+    return re.compile(rf"(?P<deployment>{alternatives})-[a-z0-9]+-[a-z0-9]+")
+
 class AMP:
     @handle_exceptions
     def __init__(self, workspace_id: str, region: str):
@@ -28,28 +71,68 @@ class AMP:
         self.workspace_id = workspace_id
         self.base_url = f"https://aps-workspaces.{region}.amazonaws.com/workspaces/{workspace_id}"
         logger.debug(f"AMP base URL: {self.base_url}")
+
+        # Reuse one pooled, keep-alive session for every query against the workspace
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=MAX_CONCURRENT_QUERIES,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
         
+        # Cached credentials and SigV4 auth, see _auth()
+        self._credentials = None
+        self._auth_obj = None
+        self._auth_key = None
+
         # Verify credentials on initialization
         self._auth()
         logger.debug("Successfully initialized AMP client with valid credentials")
 
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     @handle_exceptions
     def _auth(self):
-        """Create sigv4 auth for requests."""
+        """
+        Return sigv4 auth for requests.
+
+        The AWS4Auth object (and its derived signing key) is cached and only
+        rebuilt when the credentials are refreshed or the UTC signing date rolls over.
+        """
+        if self._credentials is None:
+            self._credentials = _BOTO_SESSION.get_credentials()
+            if not self._credentials:
+                raise ValueError("No AWS credentials found")
+
+        # Refreshable credentials renew themselves here shortly before expiry
+        frozen = self._credentials.get_frozen_credentials()
+        auth_key = (frozen.access_key, frozen.secret_key, frozen.token, datetime.now(timezone.utc).date())
+        if auth_key == self._auth_key:
+            return self._auth_obj
+
         logger.debug("Creating AWS SigV4 authentication")
-        credentials = Session().get_credentials()
-        if not credentials:
-            raise ValueError("No AWS credentials found")
-        
-        auth = AWS4Auth(
-            credentials.access_key,
-            credentials.secret_key,
+        self._auth_obj = AWS4Auth(
+            frozen.access_key,
+            frozen.secret_key,
             self.region,
             'aps',
-            session_token=credentials.token
+            session_token=frozen.token
         )
+        self._auth_key = auth_key
         logger.debug("Successfully created AWS SigV4 authentication")
-        return auth
+        return self._auth_obj
 
     @handle_exceptions
     def query(self, query: str):
@@ -58,7 +141,7 @@ class AMP:
         params = {'query': query}
         logger.debug(f"Executing instant query: {query}")
 
-        response = requests.get(
+        response = self._session.get(
             url=endpoint,
             auth=self._auth(),
             params=params,
@@ -66,10 +149,30 @@ class AMP:
         )
         response.raise_for_status()
         
-        result = response.json()
+        result = orjson.loads(response.content)
         logger.debug(f"Query successful, result status: {result.get('status', 'unknown')}")
         return result
 
+    @handle_exceptions
+    def query_many(self, queries: List[str]) -> List[dict]:
+        """
+        Execute several instant queries concurrently.
+
+        Queries are fanned out over a thread pool sharing the pooled session,
+        so the round trips overlap instead of running back to back.
+
+        Args:
+            queries: The PromQL queries to execute
+
+        Returns:
+            List of query results in the same order as the queries
+        """
+        if not queries:
+            return []
+        logger.debug(f"Executing {len(queries)} instant queries concurrently")
+        with ThreadPoolExecutor(max_workers=min(len(queries), MAX_CONCURRENT_QUERIES)) as executor:
+            return list(executor.map(self.query, queries))
+
     @handle_exceptions
     def query_range(self, query: str, start: float, end: float, step: str):
         """
@@ -80,6 +183,9 @@ class AMP:
             start: Unix timestamp for start time (in seconds)
             end: Unix timestamp for end time (in seconds)
             step: Step interval for data points (e.g., '5m' for 5-minute intervals)
+
+        Each series in the result carries its samples as float64 arrays under
+        'np_ts' (timestamps) and 'np_values' (values) instead of the raw 'values' pairs.
         """
         endpoint = f"{self.base_url}/api/v1/query_range"
         
@@ -92,25 +198,51 @@ class AMP:
         logger.debug(f"Executing range query: {query}")
         logger.debug(f"Time range: {datetime.fromtimestamp(start)} to {datetime.fromtimestamp(end)}, step: {step}")
 
-        response = requests.get(
+        response = self._session.get(
             url=endpoint,
             auth=self._auth(),
             params=params,
             timeout=30
         )
         response.raise_for_status()
-        result = response.json()
-        data_points = len(result.get('data', {}).get('result', [{}])[0].get('values', []))
+        result = orjson.loads(response.content)
+
+        # Convert the [timestamp, "value"] pairs of each series into contiguous arrays once
+        data_points = 0
+        for series in result.get('data', {}).get('result', []):
+            values = series.pop('values', [])
+            series['np_ts'] = np.asarray([v[0] for v in values], dtype=np.float64)
+            series['np_values'] = np.asarray([v[1] for v in values], dtype=np.float64)
+            data_points += series['np_values'].size
         logger.debug(f"Range query successful, received {data_points} data points")
         return result
 
+    def query_range_many(self, queries: List[str], start: float, end: float, step: str) -> List[dict]:
+        """
+        Execute several range queries over the same time window concurrently.
+
+        Args:
+            queries: The PromQL queries to execute
+            start: Unix timestamp for start time (in seconds)
+            end: Unix timestamp for end time (in seconds)
+            step: Step interval for data points (e.g., '5m' for 5-minute intervals)
+
+        Returns:
+            List of query results in the same order as the queries
+        """
+        if not queries:
+            return []
+        logger.debug(f"Executing {len(queries)} range queries concurrently")
+        with ThreadPoolExecutor(max_workers=min(len(queries), MAX_CONCURRENT_QUERIES)) as executor:
+            return list(executor.map(lambda q: self.query_range(q, start, end, step), queries))
+
     @handle_exceptions
     def get_pod_names(self, namespace: str, deployment: str) -> list:
         """Get list of pod names for a deployment."""
         logger.debug(f"Getting pod names for deployment {deployment} in namespace {namespace}")
         query = f'''kube_pod_info{{
             namespace="{namespace}",
-            pod=~"{deployment}-[a-z0-9]+-[a-z0-9]+"
+            pod=~"{pod_selector((deployment,))}"
         }}'''
         
         response = self.query(query)
@@ -119,6 +251,91 @@ class AMP:
         logger.debug(f"Found {len(pods)} pods for deployment {deployment}")
         return pods
 
+    @handle_exceptions
+    def get_pod_names_bulk(self, namespace: str, deployments: List[str]) -> Dict[str, list]:
+        """
+        Get pod names for several deployments in a namespace with a single query.
+
+        The deployments are OR-ed into one pod regex and the returned series are
+        grouped back by deployment on the client side.
+
+        Args:
+            namespace: Namespace of the deployments
+            deployments: Deployment names
+
+        Returns:
+            Dict mapping each deployment name to its list of pods
+        """
+        if not deployments:
+            return {}
+        logger.debug(f"Getting pod names for {len(deployments)} deployments in namespace {namespace}")
+        query = f'''kube_pod_info{{
+            namespace="{namespace}",
+            pod=~"{pod_selector(tuple(deployments))}"
+        }}'''
+
+        response = self.query(query)
+
+        # Prometheus anchors label regexes, so demultiplex with full matches as well
+        matcher = _pod_regex(tuple(deployments))
+        pods = {deployment: [] for deployment in deployments}
+        for series in response["data"]["result"]:
+            pod_name = series["metric"]["pod"]
+            match = matcher.fullmatch(pod_name)
+            if match:
+                pods[match.group("deployment")].append({"name": pod_name})
+
+        logger.debug(f"Found {sum(len(p) for p in pods.values())} pods across {len(deployments)} deployments")
+        return pods
+
+    @handle_exceptions
+    def get_containers_bulk(self, deployments: List[dict]) -> Dict[Tuple[str, str], List[str]]:
+        """
+        Get the container names of many deployments with batched kube_pod_container_info queries.
+
+        Deployments are OR-ed into namespace and pod regexes, CONTAINER_QUERY_BATCH_SIZE
+        at a time to keep the query URLs short, and the batches run concurrently.
+        Series are grouped back per namespace so a deployment name only matches
+        pods in its own namespace.
+
+        Args:
+            deployments: Deployments as dicts with 'namespace' and 'name'
+
+        Returns:
+            Dict mapping (namespace, deployment name) to its sorted container names
+        """
+        if not deployments:
+            return {}
+
+        batches = [
+            deployments[i:i + CONTAINER_QUERY_BATCH_SIZE]
+            for i in range(0, len(deployments), CONTAINER_QUERY_BATCH_SIZE)
+        ]
+        queries = []
+        for batch in batches:
+            ns_regex = "|".join(sorted({escape_promql_regex(d['namespace']) for d in batch}))
+            queries.append(f'''kube_pod_container_info{{
+                namespace=~"{ns_regex}",
+                pod=~"{pod_selector(tuple(d['name'] for d in batch))}"
+            }}''')
+        logger.debug(f"Discovering containers of {len(deployments)} deployments with {len(queries)} queries")
+
+        names_by_namespace: Dict[str, List[str]] = {}
+        for d in deployments:
+            names_by_namespace.setdefault(d['namespace'], []).append(d['name'])
+        matchers = {namespace: _pod_regex(tuple(names)) for namespace, names in names_by_namespace.items()}
+
+        containers = {(d['namespace'], d['name']): set() for d in deployments}
+        for response in self.query_many(queries):
+            for series in response["data"]["result"]:
+                metric = series["metric"]
+                matcher = matchers.get(metric.get("namespace"))
+                match = matcher.fullmatch(metric.get("pod", "")) if matcher else None
+                if match:
+                    containers[(metric["namespace"], match.group("deployment"))].add(metric["container"])
+
+        return {key: sorted(names) for key, names in containers.items()}
+
     @handle_exceptions
     def get_cluster_name(self) -> str:
         """Get the EKS cluster ARN."""
@@ -3,7 +3,7 @@ ArgoCD client for interacting with GitOps deployments.
 
 This module provides functionality to:
 1. List ArgoCD applications in the cluster
-2. Get Git repository information for applications
+2. Get Git repository information for applications from a single listing
 3. Execute ArgoCD CLI commands safely
 
 Key features:
@@ -75,27 +75,21 @@ def get_argocd_instance() -> Optional[List[Dict[str, Any]]]:
 
 
 @handle_exceptions
-def get_argocd_app_git_path(argocd_app: str) -> Optional[tuple[str, str]]:
-    """Use ArgoCD CLI to get the app's Git repo and path."""
-    result = subprocess.run(
-        [
-            "argocd", "app", "get",
-            argocd_app,
-            "--output", "json"
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        check=False
-    )
+def get_argocd_app_git_paths(argocd_apps: Optional[List[Dict[str, Any]]] = None) -> Dict[str, tuple[str, str]]:
+    """
+    Map each ArgoCD app name to its Git repo and path.
 
-    if result.stdout:
-        json_data = json.loads(result.stdout)
-        repo_url = json_data["spec"]["source"]["repoURL"]
-        path = json_data["spec"]["source"]["path"]
-        logger.debug(f"Found Git repo {repo_url} and path {path} for ArgoCD app {argocd_app}")
-        return repo_url, path
+    Uses the payload of a single `argocd app list` call (or the apps passed in)
+    instead of one `argocd app get` process per application.
+    """
+    if argocd_apps is None:
+        argocd_apps = get_argocd_instance() or []
 
-    logger.debug(f"No Git repo and path found for ArgoCD app {argocd_app}")
-    return None
+    git_paths = {}
+    for app in argocd_apps:
+        source = app.get("spec", {}).get("source", {})
+        if "repoURL" in source:
+            git_paths[app["metadata"]["name"]] = (source["repoURL"], source.get("path", ""))
 
+    logger.debug(f"Found Git repo and path for {len(git_paths)} ArgoCD apps")
+    return git_paths
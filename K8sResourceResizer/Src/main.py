@@ -10,6 +10,7 @@ This module orchestrates the resource optimization process by:
 
 import os
 import sys
+import multiprocessing
 from pathlib import Path
 import click
 from dotenv import load_dotenv
@@ -19,7 +20,7 @@ from resource_optimizer import ResourceOptimizer
 from manifest_updater import process_deployments
 from parser import get_applications_as_string
 from argocd_client import apply_manifest
-import json
+import orjson
 import secrets
 from prompt_creator import build_model_prompt, python_incontext_learning
 from pr_opener import clone_github_repo, invoke_bedrock_model, create_and_switch_to_branch, create_github_pull_request, commit_and_push_changes
@@ -100,7 +101,7 @@ def main(directory, output, debug, strategy, cpu_percentile, memory_buffer, hist
         memory_buffer=memory_buffer,
         business_hours_start=int(os.getenv('BUSINESS_HOURS_START', '9')),
         business_hours_end=int(os.getenv('BUSINESS_HOURS_END', '17')),
-        business_days=[int(d) for d in os.getenv('BUSINESS_DAYS', '0,1,2,3,4').split(',')],
+        business_days=frozenset(int(d) for d in os.getenv('BUSINESS_DAYS', '0,1,2,3,4').split(',')),
         trend_threshold=float(os.getenv('TREND_THRESHOLD', '0.1')),
         high_variance_threshold=float(os.getenv('HIGH_VARIANCE_THRESHOLD', '0.5')),
         history_window_hours=history_hours
@@ -126,7 +127,8 @@ def main(directory, output, debug, strategy, cpu_percentile, memory_buffer, hist
     optimizer = ResourceOptimizer(
         workspace_id=os.getenv('AMP_WORKSPACE_ID'),
         region=os.getenv('AWS_REGION'),
-        strategy=strategy_instance
+        strategy=strategy_instance,
+        max_workers=int(os.getenv('RECOMMENDATION_WORKERS', '0')) or None
     )
     
     # Generate recommendations
@@ -142,8 +144,9 @@ def main(directory, output, debug, strategy, cpu_percentile, memory_buffer, hist
     
     # Save recommendations to file
     logger.info(f"Using TEMP directory: {temp_dir}")
-    with open(os.path.join(temp_dir, "recommendations.json"), 'w') as f:
-        json.dump(recommendations_data, f, indent=2)
+    # orjson encodes straight to bytes (NumPy scalars included) without an intermediate str
+    with open(os.path.join(temp_dir, "recommendations.json"), 'wb') as f:
+        f.write(orjson.dumps(recommendations_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     logger.info("Resource optimization process completed")
 
@@ -159,7 +162,8 @@ def main(directory, output, debug, strategy, cpu_percentile, memory_buffer, hist
     local_dir = os.path.join(temp_base, repo_name)
     random_number = secrets.randbelow(1000) + 1  # Generate number between 1 and 1000
     new_branch_name = f"update_resources_k8s_manifests_{random_number}"
-    clone_github_repo(repo_url, local_dir)
+    destination_branch = "main"
+    clone_github_repo(repo_url, local_dir, destination_branch)
 
     model_prompt = build_model_prompt(recommendations_data, repo_name)
     final_model_prompt = python_incontext_learning + model_prompt # Adding in-context learning
@@ -172,7 +176,6 @@ def main(directory, output, debug, strategy, cpu_percentile, memory_buffer, hist
 
     
     source_branch = new_branch_name
-    destination_branch = "main"
     title = "K8s manifest resource usage updates, please take a look and update with the following recommendations"
 
     create_github_pull_request(repository_full_name, source_branch, destination_branch, title, response_for_pr_description)
@@ -180,4 +183,6 @@ def main(directory, output, debug, strategy, cpu_percentile, memory_buffer, hist
 
 
 if __name__ == "__main__":
+    # Required for the YAML parser's process pool in the frozen (pyinstaller) binary
+    multiprocessing.freeze_support()
     main()
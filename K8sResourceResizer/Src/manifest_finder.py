@@ -13,12 +13,46 @@ Key functionalities:
 """
 
 import os
+import re
+import mmap
 import yaml
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from logger import logger
-from typing import List, Optional, Dict
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+from typing import Iterator, List, Optional, Dict
 from utils import handle_exceptions
 
+# Top-level `kind: Application` / `kind: ApplicationSet`, optionally quoted
+_APPLICATION_KIND = re.compile(rb"^kind:[ \t]*[\"']?Application", re.MULTILINE)
+
+
+def _iter_yaml_files(directory: str) -> Iterator[str]:
+    """
+    Recursively yield YAML file paths using os.scandir.
+
+    DirEntry caches the file type, so no extra stat is needed per entry. Files
+    are yielded before descending into subdirectories, matching os.walk order.
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith((".yaml", ".yml")) and not entry.is_dir():
+                    yield entry.path
+    except OSError as e:
+        logger.warning(f"Unable to scan directory {directory}: {e}")
+        return
+
+    for subdir in subdirs:
+        yield from _iter_yaml_files(subdir)
+
 
 @handle_exceptions
 def get_yaml_files(directory: str) -> List[str]:
@@ -26,30 +60,57 @@ def get_yaml_files(directory: str) -> List[str]:
     Fetch all YAML files in a directory.
     """
     logger.info(f"🤖 Fetching all files in dir: {directory}")
-    yaml_files = [
-        os.path.join(root, file)
-        for root, _, files in os.walk(directory)
-        for file in files
-        if file.endswith((".yaml", ".yml"))
-    ]
+    yaml_files = list(_iter_yaml_files(directory))
     logger.debug(f"🤖 Found {len(yaml_files)} YAML files")
     return yaml_files
 
 
+def _may_contain_application(file_path: str) -> bool:
+    """
+    Cheap byte-level check whether a file can hold an Argo CD Application[Set].
+    False positives are filtered out later by get_applications.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return _APPLICATION_KIND.search(f.read()) is not None
+    except OSError as e:
+        logger.warning(f"Unable to read {file_path}: {e}")
+        return False
+
+
+def get_application_yaml_files(directory: str) -> List[str]:
+    """
+    Fetch the YAML files in a directory that may declare Argo CD Application[Set]s.
+    """
+    yaml_files = [path for path in get_yaml_files(directory) if _may_contain_application(path)]
+    logger.debug(f"🤖 {len(yaml_files)} YAML files may contain Argo CD Application[Sets]")
+    return yaml_files
+
+
+def _parse_yaml_file(file_path: str) -> List[dict]:
+    """
+    Parse all non-empty documents of a single YAML file.
+    """
+    logger.debug(f"Processing file: {file_path}")
+    with open(file_path, "rb") as f:
+        return [doc for doc in yaml.load_all(f, Loader=SafeLoader) if doc is not None]
+
+
 @handle_exceptions
 def parse_yaml(files: List[str]) -> List[dict]:
     """
     Parse YAML files into dictionaries.
+
+    Files are read and parsed on a thread pool so file I/O overlaps; the pool
+    size can be set with the YAML_PARSE_WORKERS environment variable.
     """
-    resources = []
-    for file_path in files:
-        logger.debug(f"Processing file: {file_path}")
-        with open(file_path, "r") as f:
-            documents = list(yaml.safe_load_all(f))
-            for doc in documents:
-                if doc is not None:
-                    resources.append(doc)
-    return resources
+    max_workers = int(os.getenv("YAML_PARSE_WORKERS", min(32, (os.cpu_count() or 4) * 4)))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return [doc for docs in executor.map(_parse_yaml_file, files) for doc in docs]
+
+
+# Kinds kept by get_applications
+APPLICATION_KINDS = frozenset({"Application", "ApplicationSet"})
 
 
 @handle_exceptions
@@ -74,7 +135,7 @@ def get_applications(resources: List[dict], selector: Optional[str] = None) -> L
 
     for resource in resources:
         kind = resource.get("kind")
-        if kind not in ["Application", "ApplicationSet"]:
+        if kind not in APPLICATION_KINDS:
             continue
 
         metadata = resource.get("metadata", {})
@@ -91,9 +152,12 @@ def get_applications(resources: List[dict], selector: Optional[str] = None) -> L
 
 
 @handle_exceptions
-def patch_applications(applications: List[dict]) -> str:
+def patch_applications(applications: List[dict]) -> List[dict]:
     """
-    Patch applications and convert them back to YAML.
+    Patch applications in place for the local Argo CD instance.
+
+    Returns:
+        The same list of applications, mutated
     """
     logger.info(f"🤖 Patching {len(applications)} Argo CD Application[Sets]")
 
@@ -104,13 +168,20 @@ def patch_applications(applications: List[dict]) -> str:
             spec["destination"]["name"] = "in-cluster"
             spec["destination"].pop("server", None)
         spec["project"] = "default"
-        spec.pop("syncPolicy", None)
+        spec.pop("syncPolicy", None)  # Remove existing sync policy
         spec["syncPolicy"] = {
             "syncOptions": ["CreateNamespace=true"]
         }
 
-    output = "\n---\n".join([yaml.dump(app) for app in applications])
-    return output
+    return applications
+
+
+@handle_exceptions
+def patch_applications_to_yaml(applications: List[dict]) -> str:
+    """
+    Patch applications and convert them back to a multi-document YAML string.
+    """
+    return yaml.dump_all(patch_applications(applications), Dumper=SafeDumper, sort_keys=False)
 
 
 @handle_exceptions
@@ -118,23 +189,11 @@ def get_applications_as_string(directory: str, selector: Optional[str] = None) -
     """
     Get applications as a string after parsing.
     """
-    yaml_files = get_yaml_files(directory)
+    clear_manifest_caches()
+    yaml_files = get_application_yaml_files(directory)
     resources = parse_yaml(yaml_files)
     applications = get_applications(resources, selector)
-    
-    for app in applications:
-        app["metadata"]["namespace"] = "argocd"
-        spec = app.get("spec", {})
-        if "destination" in spec:
-            spec["destination"]["name"] = "in-cluster"
-            spec["destination"].pop("server", None)
-        spec["project"] = "default"
-        spec.pop("syncPolicy", None)  # Remove existing sync policy
-        spec["syncPolicy"] = {
-            "syncOptions": ["CreateNamespace=true"]
-        }
-        
-    return yaml.dump_all([app for app in applications])
+    return patch_applications_to_yaml(applications)
 
 
 @handle_exceptions
@@ -150,7 +209,7 @@ def find_helm_resource_files(base_dir: str, path: str, helm_values: list[str], d
             
         with open(full_path, 'r') as f:
             try:
-                content = yaml.safe_load(f)
+                content = yaml.load(f, Loader=SafeLoader)
                 if content and 'resources' in content:
                     logger.debug(f"Found resource definitions in {full_path}")
                     return full_path
@@ -162,76 +221,87 @@ def find_helm_resource_files(base_dir: str, path: str, helm_values: list[str], d
     return None
 
 
-@handle_exceptions
-def find_kustomize_resource_files(base_dir: str, path: str, deployment_name: str) -> Optional[str]:
-    """Find resource definitions in Kustomize files."""
-    logger.debug(f"Looking for Kustomize files in {base_dir}/{path}")
-    logger.debug(f"Searching for deployment: {deployment_name}")
-    
-    kustomization_path = os.path.join(base_dir, path, "kustomization.yaml")
+@lru_cache(maxsize=4096)
+def _check_file_for_deployment(file_path: str) -> Optional[str]:
+    """Check if a file contains resource definitions."""
+    if not os.path.exists(file_path):
+        logger.debug(f"File does not exist: {file_path}")
+        return None
+        
+    try:
+        with open(file_path, 'rb') as f:
+            # Both checks below need a 'resources' key, so skip the YAML parse when the bytes lack it
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"resources") == -1:
+                    return None
+
+            f.seek(0)
+            file_content = yaml.load(f, Loader=SafeLoader)
+            if not file_content:
+                return None
+
+            # Check for resources in a deployment
+            if file_content.get('kind') == 'Deployment':
+                containers = file_content.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
+                for container in containers:
+                    if 'resources' in container:
+                        logger.debug(f"Found deployment with resources in {file_path}")
+                        return file_path
+
+            # Check for resources in a patch
+            if 'resources' in file_content:
+                resources = file_content.get('resources', {})
+                if 'limits' in resources or 'requests' in resources:
+                    logger.debug(f"Found patch with resource definitions in {file_path}")
+                    return file_path
+                
+    except Exception as e:
+        logger.debug(f"Error checking file {file_path}: {str(e)}")
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _find_kustomize_cached(kustomization_dir: str, deployment_name: str) -> Optional[str]:
+    """
+    Find resource definitions under an absolute Kustomize directory.
+
+    Memoized so bases shared by several overlays are only parsed once per run.
+    """
+    kustomization_path = os.path.join(kustomization_dir, "kustomization.yaml")
     logger.debug(f"Checking kustomization path: {kustomization_path}")
     
     if not os.path.exists(kustomization_path):
-        kustomization_path = os.path.join(base_dir, path, "kustomization.yml")
+        kustomization_path = os.path.join(kustomization_dir, "kustomization.yml")
         logger.debug(f"First path not found, checking alternate: {kustomization_path}")
         if not os.path.exists(kustomization_path):
-            logger.debug(f"No kustomization file found in {path}")
+            logger.debug(f"No kustomization file found in {kustomization_dir}")
             return None
     
     try:
         with open(kustomization_path, 'r') as f:
-            content = yaml.safe_load(f)
-            logger.debug(f"Loaded kustomization content: {json.dumps(content, indent=2)}")
+            content = yaml.load(f, Loader=SafeLoader)
+            logger.opt(lazy=True).debug("Loaded kustomization content: {}", lambda: json.dumps(content, indent=2))
             
             if not content:
                 logger.debug("Empty kustomization file")
                 return None
 
-            def check_file_for_deployment(file_path: str) -> Optional[str]:
-                """Helper function to check if a file contains resource definitions."""
-                if not os.path.exists(file_path):
-                    logger.debug(f"File does not exist: {file_path}")
-                    return None
-                    
-                try:
-                    with open(file_path, 'r') as f:
-                        file_content = yaml.safe_load(f)
-                        if not file_content:
-                            return None
-
-                        # Check for resources in a deployment
-                        if file_content.get('kind') == 'Deployment':
-                            containers = file_content.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
-                            for container in containers:
-                                if 'resources' in container:
-                                    logger.debug(f"Found deployment with resources in {file_path}")
-                                    return file_path
-
-                        # Check for resources in a patch
-                        if 'resources' in file_content:
-                            resources = file_content.get('resources', {})
-                            if 'limits' in resources or 'requests' in resources:
-                                logger.debug(f"Found patch with resource definitions in {file_path}")
-                                return file_path
-                            
-                except Exception as e:
-                    logger.debug(f"Error checking file {file_path}: {str(e)}")
-                return None
-
             # Check both resources and patches in current directory
             all_files = []
             
             # Add resources
             resources = content.get('resources', [])
-            logger.debug(f"Found resources in {kustomization_path}: {resources}")
+            logger.debug("Found resources in {}: {}", kustomization_path, resources)
             for resource in resources:
-                resource_path = os.path.abspath(os.path.join(os.path.dirname(kustomization_path), resource))
+                resource_path = os.path.abspath(os.path.join(kustomization_dir, resource))
                 logger.debug(f"Adding resource path: {resource_path}")
                 all_files.append(resource_path)
             
             # Add patches
             patches = content.get('patches', [])
-            logger.debug(f"Found patches in {kustomization_path}: {patches}")
+            logger.debug("Found patches in {}: {}", kustomization_path, patches)
             for patch in patches:
                 if isinstance(patch, dict):
                     patch_path = patch.get('path')
@@ -240,32 +310,30 @@ def find_kustomize_resource_files(base_dir: str, path: str, deployment_name: str
                     patch_path = patch
                     logger.debug(f"Found patch string: {patch_path}")
                 if patch_path:
-                    patch_path = os.path.abspath(os.path.join(os.path.dirname(kustomization_path), patch_path))
+                    patch_path = os.path.abspath(os.path.join(kustomization_dir, patch_path))
                     logger.debug(f"Adding patch path: {patch_path}")
                     all_files.append(patch_path)
             
             # Check all files
-            logger.debug(f"Checking all files: {all_files}")
+            logger.debug("Checking all files: {}", all_files)
             for file_path in all_files:
                 if os.path.isdir(file_path):
                     # If it's a directory, recursively check it
                     logger.debug(f"Checking directory: {file_path}")
-                    relative_path = os.path.relpath(file_path, base_dir)
-                    result = find_kustomize_resource_files(base_dir, relative_path, deployment_name)
+                    result = _find_kustomize_cached(file_path, deployment_name)
                     if result:
                         return result
                 else:
-                    result = check_file_for_deployment(file_path)
+                    result = _check_file_for_deployment(file_path)
                     if result:
                         return result
             
             # Check bases if nothing found
             bases = content.get('bases', [])
             for base in bases:
-                base_path = os.path.abspath(os.path.join(os.path.dirname(kustomization_path), base))
+                base_path = os.path.abspath(os.path.join(kustomization_dir, base))
                 if os.path.exists(base_path):
-                    relative_path = os.path.relpath(base_path, base_dir)
-                    result = find_kustomize_resource_files(base_dir, relative_path, deployment_name)
+                    result = _find_kustomize_cached(base_path, deployment_name)
                     if result:
                         return result
     
@@ -278,3 +346,17 @@ def find_kustomize_resource_files(base_dir: str, path: str, deployment_name: str
     
     logger.debug(f"No Kustomize files found with resource definitions")
     return None
+
+
+def clear_manifest_caches() -> None:
+    """Drop memoized Kustomize lookups so a new run sees the current files."""
+    _find_kustomize_cached.cache_clear()
+    _check_file_for_deployment.cache_clear()
+
+
+@handle_exceptions
+def find_kustomize_resource_files(base_dir: str, path: str, deployment_name: str) -> Optional[str]:
+    """Find resource definitions in Kustomize files."""
+    logger.debug(f"Looking for Kustomize files in {base_dir}/{path}")
+    logger.debug(f"Searching for deployment: {deployment_name}")
+    return _find_kustomize_cached(os.path.abspath(os.path.join(base_dir, path)), deployment_name)
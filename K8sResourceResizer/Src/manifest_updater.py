@@ -13,13 +13,23 @@ Key functionalities:
 """
 
 import os
+import stat
+import tempfile
 from typing import Optional, Tuple, List, Dict, Any
 from logger import logger
-from argocd_client import get_argocd_instance, get_argocd_app_git_path
+from argocd_client import get_argocd_instance
 import yaml
-from manifest_finder import find_helm_resource_files, find_kustomize_resource_files
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+from manifest_finder import find_helm_resource_files, find_kustomize_resource_files, clear_manifest_caches
 from utils import handle_exceptions
 import json
+import re
+
+# Any `key:` line of a block-style YAML manifest, with its indentation (list dashes included)
+MANIFEST_KEY_RE = re.compile(rb'^(?P<indent>[ \t]*(?:- +)*)(?P<key>[A-Za-z0-9_.\-]+):(?P<rest>[^\r\n]*)', re.MULTILINE)
 
 @handle_exceptions
 def process_deployments(recommendations: dict, base_dir: str) -> list[dict]:
@@ -37,49 +47,39 @@ def process_deployments(recommendations: dict, base_dir: str) -> list[dict]:
         logger.warning("No recommendations provided, skipping deployment processing")
         return []
 
-    # Extract new limits and requests from recommendations
-    new_limits = {}
-    new_requests = {}
+    # Start from fresh Kustomize lookups for this run
+    clear_manifest_caches()
+
     updated_deployments = []
     
-    logger.debug(f"Full recommendations structure: {json.dumps(recommendations, indent=2)}")
+    logger.opt(lazy=True).debug("Full recommendations structure: {}", lambda: json.dumps(recommendations, indent=2))
 
-    # Process each container's recommendations
-    for full_key, data in recommendations.items():
-        if not data or 'recommended' not in data:
-            logger.debug(f"No recommendations for {full_key}, skipping")
-            continue
-            
-        recommended = data['recommended']
-        
-        # Extract limits
-        limits = recommended.get('limits', {})
-        if limits:
-            new_limits[full_key] = {
-                k: str(v['value']) for k, v in limits.items() 
-                if v['value'] is not None
-            }
-            logger.debug(f"Extracted limits for {full_key}: {new_limits[full_key]}")
-        
-        # Extract requests
-        requests = recommended.get('requests', {})
-        if requests:
-            new_requests[full_key] = {
-                k: str(v['value']) for k, v in requests.items()
-                if v['value'] is not None
-            }
-            logger.debug(f"Extracted requests for {full_key}: {new_requests[full_key]}")
+    # Extract the non-null limit and request values of each container
+    new_limits = {
+        full_key: {k: str(v['value']) for k, v in data['recommended']['limits'].items() if v['value'] is not None}
+        for full_key, data in recommendations.items()
+        if data and data.get('recommended', {}).get('limits')
+    }
+    new_requests = {
+        full_key: {k: str(v['value']) for k, v in data['recommended']['requests'].items() if v['value'] is not None}
+        for full_key, data in recommendations.items()
+        if data and data.get('recommended', {}).get('requests')
+    }
+    logger.debug("Extracted limits: {}", new_limits)
+    logger.debug("Extracted requests: {}", new_requests)
     
     if not new_limits and not new_requests:
         logger.warning("No valid recommendations found to process")
         return []
 
-    # Get all deployments from recommendations
-    recommendation_deployments = {
-        tuple(key.split('/')[:2])  # Only take namespace and deployment name
-        for key in recommendations.keys()
-    }
-    logger.debug(f"Recommendation deployments: {recommendation_deployments}")
+    # Group container recommendations by (namespace, deployment name) once
+    by_deployment: dict[tuple[str, str], list[tuple[str, dict]]] = {}
+    for full_key, data in recommendations.items():
+        parts = full_key.split('/', 2)
+        if len(parts) >= 2:
+            by_deployment.setdefault((parts[0], parts[1]), []).append((full_key, data))
+    recommendation_deployments = by_deployment.keys()
+    logger.debug("Recommendation deployments: {}", recommendation_deployments)
     
     # Get all ArgoCD applications
     argocd_apps = get_argocd_instance()
@@ -87,22 +87,30 @@ def process_deployments(recommendations: dict, base_dir: str) -> list[dict]:
         logger.warning("No ArgoCD applications found")
         return []
     
-    # Get deployments from ArgoCD apps
-    argocd_deployments = set()
-    for app in argocd_apps:
-        resources = app.get('status', {}).get('resources', [])
-        for resource in resources:
-            if resource.get('kind') == 'Deployment':
-                argocd_deployments.add((
-                    resource['namespace'],
-                    resource['name']
-                ))
+    # Collect each app's Deployments in a single walk of its status resources
+    apps_with_deps = [
+        (app, [
+            (resource['namespace'], resource['name'])
+            for resource in (app.get('status') or {}).get('resources') or ()
+            if resource.get('kind') == 'Deployment'
+        ])
+        for app in argocd_apps
+    ]
+    
+    # Index them by deployment; iterating in reverse keeps the first app
+    # that lists a deployment, as the previous linear search did
+    app_by_deployment = {
+        deployment: app
+        for app, deployments in reversed(apps_with_deps)
+        for deployment in deployments
+    }
+    argocd_deployments = app_by_deployment.keys()
     
-    logger.debug(f"Found ArgoCD deployments: {argocd_deployments}")
+    logger.debug("Found ArgoCD deployments: {}", argocd_deployments)
     
     # Find intersection of deployments
     deployments_to_process = recommendation_deployments & argocd_deployments
-    logger.debug(f"Intersection result: {deployments_to_process}")
+    logger.debug("Intersection result: {}", deployments_to_process)
     
     # Process intersecting deployments
     for namespace, name in deployments_to_process:
@@ -110,38 +118,27 @@ def process_deployments(recommendations: dict, base_dir: str) -> list[dict]:
         logger.debug(f"Processing deployment: {deployment_key}")
         
         # Get the deployment data from recommendations
-        deployment_data = next(
-            (data['object'] for key, data in recommendations.items() 
-             if key.startswith(f"{deployment_key}/")),
-            None
-        )
+        deployment_entries = by_deployment[(namespace, name)]
+        deployment_data = deployment_entries[0][1]['object']
         
         if not deployment_data:
             logger.warning(f"Could not find deployment data for {deployment_key}")
             continue
         
         # Find the corresponding ArgoCD app
-        app = next((app for app in argocd_apps 
-                   if any(resource['kind'] == 'Deployment' 
-                         and resource['namespace'] == namespace 
-                         and resource['name'] == name 
-                         for resource in app.get('status', {}).get('resources', []))), None)
-        
-        if not app:
-            logger.warning(f"Could not find ArgoCD app for deployment {deployment_key}")
-            continue
+        app = app_by_deployment[(namespace, name)]
         
         # Filter limits and requests for just this deployment
         filtered_limits = {
-            container_key: limits 
-            for container_key, limits in new_limits.items()
-            if container_key.startswith(f"{deployment_key}/")
+            container_key: new_limits[container_key]
+            for container_key, _ in deployment_entries
+            if container_key in new_limits
         }
         
         filtered_requests = {
-            container_key: requests 
-            for container_key, requests in new_requests.items()
-            if container_key.startswith(f"{deployment_key}/")
+            container_key: new_requests[container_key]
+            for container_key, _ in deployment_entries
+            if container_key in new_requests
         }
         
         # Get app source info
@@ -197,56 +194,101 @@ def update_manifest_with_new_resources(file_path: str, new_limits: dict, new_req
     """
     Update resource limits and requests in a manifest file.
     Preserves file structure and only updates values after the colon.
+
+    Sections are tracked by indentation: a `resources:` block (and its
+    `limits:`/`requests:` children) ends at the next key that is not
+    indented deeper than the block's own key.
     """
     logger.debug(f"Updating manifest file: {file_path}")
     logger.debug(f"New limits: {new_limits}")
     logger.debug(f"New requests: {new_requests}")
     
-    updated_lines = []
-    in_resources = False
-    in_limits = False
-    in_requests = False
+    with open(file_path, 'rb') as file:
+        file_stat = os.fstat(file.fileno())
+        data = file.read()
     
-    with open(file_path, 'r') as file:
-        for line in file:
-            # Track which section we're in
-            if 'resources:' in line:
-                in_resources = True
-            elif in_resources and line.strip() == '':
-                in_resources = False
-                in_limits = False
-                in_requests = False
-            elif in_resources and 'limits:' in line:
-                in_limits = True
-                in_requests = False
-            elif in_resources and 'requests:' in line:
-                in_requests = True
-                in_limits = False
-            
-            # Update values if we're in the right section
-            if in_limits and new_limits:
-                if 'cpu:' in line:
-                    line = line.split('cpu:')[0] + f"cpu: {new_limits['cpu']}\n"
-                elif 'memory:' in line:
-                    line = line.split('memory:')[0] + f"memory: {new_limits['memory']}\n"
-            elif in_requests and new_requests:
-                if 'cpu:' in line:
-                    line = line.split('cpu:')[0] + f"cpu: {new_requests['cpu']}\n"
-                elif 'memory:' in line:
-                    line = line.split('memory:')[0] + f"memory: {new_requests['memory']}\n"
-            
-            updated_lines.append(line)
+    # Nothing before the first resources key can change, so only the
+    # part of the file from that line on goes through the regex
+    start = data.find(b'resources:')
+    if start == -1:
+        logger.debug(f"No resources section found in {file_path}")
+        return
+    start = data.rfind(b'\n', 0, start) + 1
     
-    with open(file_path, 'w') as file:
-        file.writelines(updated_lines)
+    # Encode the replacement values once, keyed by section and resource name
+    new_values = {
+        section: {
+            resource.encode(): str(values[resource]).encode()
+            for resource in ('cpu', 'memory')
+            if values and resource in values
+        }
+        for section, values in ((b'limits', new_limits), (b'requests', new_requests))
+    }
+    resources_indent = None
+    section = None
+    section_indent = None
+    
+    def replacement(match: re.Match) -> Optional[bytes]:
+        """New text for a matched key line, or None to keep the line as it is."""
+        nonlocal resources_indent, section, section_indent
+        indent = len(match.group('indent'))
+        key = match.group('key')
+        
+        # Leaving a block once a key is not nested under it
+        if section is not None and indent <= section_indent:
+            section = None
+        if resources_indent is not None and indent <= resources_indent:
+            resources_indent = None
+        
+        if key == b'resources':
+            resources_indent = indent
+        elif resources_indent is not None and key in new_values:
+            section, section_indent = key, indent
+        elif section is not None:
+            value = new_values[section].get(key)
+            if value is not None:
+                return match.group('indent') + key + b': ' + value
+        return None
+    
+    # (start, end, new text) of every line that actually changes
+    edits = []
+    for match in MANIFEST_KEY_RE.finditer(data, start):
+        new_line = replacement(match)
+        if new_line is not None and new_line != match.group(0):
+            edits.append((match.start(), match.end(), new_line))
+    if not edits:
+        logger.debug(f"Manifest already up to date: {file_path}")
+        return
+    
+    # Write next to the original and swap it in, so a failed write never leaves a truncated manifest
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', prefix='.resizer-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            # Unchanged spans are written straight from the read buffer
+            view = memoryview(data)
+            position = 0
+            for edit_start, edit_end, new_line in edits:
+                file.write(view[position:edit_start])
+                file.write(new_line)
+                position = edit_end
+            file.write(view[position:])
+        os.chmod(tmp_path, stat.S_IMODE(file_stat.st_mode))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     
     logger.debug(f"Successfully updated manifest: {file_path}")
 
 @handle_exceptions
 def has_resource_definitions(file_path: str) -> bool:
     """Check if a file contains resource definitions."""
-    with open(file_path, 'r') as f:
-        content = yaml.safe_load(f)
+    with open(file_path, 'rb') as f:
+        data = f.read()
+        # Most manifests never mention resources; skip the YAML parse for those
+        if b"resources" not in data:
+            return False
+        content = yaml.load(data, Loader=SafeLoader)
         if not content:
             return False
         
@@ -1,13 +1,22 @@
 import os
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from loguru import logger
-from typing import List, Optional, Dict
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper
+from typing import List, Optional, Dict, Tuple
+# Directory walking is shared with manifest_finder (os.scandir based, no per-file stat)
+from manifest_finder import get_application_yaml_files
 
 
 class K8sResource:
     def __init__(self, file_name: str, yaml_content: dict):
         self.file_name = file_name
         self.yaml_content = yaml_content
+        # Resolved once at parse time so filtering by kind is a plain attribute read
+        self.kind = yaml_content.get("kind") if isinstance(yaml_content, dict) else None
 
 
 class Application:
@@ -17,37 +26,39 @@ class Application:
         self.kind = kind
 
 
-def get_yaml_files(directory: str) -> List[str]:
+# Below this many files the cost of starting worker processes outweighs the parsing
+PARALLEL_PARSE_MIN_FILES = 32
+
+
+def _parse_one(file_path: str) -> List[Tuple[str, dict]]:
     """
-    Fetch all YAML files in a directory.
+    Parse a single YAML file into (file_path, document) pairs.
+
+    Kept at module level and free of K8sResource so it can run in a worker process.
     """
-    logger.info(f"🤖 Fetching all files in dir: {directory}")
-    yaml_files = [
-        os.path.join(root, file)
-        for root, _, files in os.walk(directory)
-        for file in files
-        if file.endswith((".yaml", ".yml"))
-    ]
-    logger.debug(f"🤖 Found {len(yaml_files)} YAML files")
-    return yaml_files
+    logger.debug(f"Processing file: {file_path}")
+    with open(file_path, "r") as f:
+        try:
+            return [(file_path, doc) for doc in yaml.load_all(f, Loader=SafeLoader) if doc is not None]
+        except yaml.YAMLError as e:
+            logger.warning(f"Failed to parse file {file_path}: {e}")
+            return []
 
 
 def parse_yaml(files: List[str]) -> List[K8sResource]:
     """
     Parse YAML files into K8sResource objects.
     """
-    resources = []
-    for file_path in files:
-        logger.debug(f"Processing file: {file_path}")
-        with open(file_path, "r") as f:
-            try:
-                documents = list(yaml.safe_load_all(f))
-                for doc in documents:
-                    if doc is not None:
-                        resources.append(K8sResource(file_path, doc))
-            except yaml.YAMLError as e:
-                logger.warning(f"Failed to parse file {file_path}: {e}")
-    return resources
+    if len(files) < PARALLEL_PARSE_MIN_FILES:
+        parsed = map(_parse_one, files)
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            parsed = list(executor.map(_parse_one, files, chunksize=16))
+    return [K8sResource(file_path, doc) for docs in parsed for file_path, doc in docs]
+
+
+# Kinds kept by get_applications
+APPLICATION_KINDS = frozenset({"Application", "ApplicationSet"})
 
 
 def parse_selector(selector: Optional[str]) -> Dict[str, str]:
@@ -73,8 +84,8 @@ def get_applications(resources: List[K8sResource], selector: Optional[str] = Non
     parsed_selector = parse_selector(selector)
 
     for resource in resources:
-        kind = resource.yaml_content.get("kind")
-        if kind not in ["Application", "ApplicationSet"]:
+        kind = resource.kind
+        if kind not in APPLICATION_KINDS:
             continue
 
         metadata = resource.yaml_content.get("metadata", {})
@@ -105,15 +116,21 @@ def patch_applications(applications: List[Application]) -> str:
         spec["project"] = "default"
         spec.pop("syncPolicy", None)
 
-    output = "\n---\n".join([yaml.dump(app.yaml_content) for app in applications])
-    return output
+    # One emitter pass; explicit_start writes the "---" document separators
+    return yaml.dump_all(
+        (app.yaml_content for app in applications),
+        Dumper=SafeDumper,
+        explicit_start=True,
+        default_flow_style=False
+    )
 
 
 def get_applications_as_string(directory: str, selector: Optional[str] = None) -> str:
     """
     Get applications as a string after parsing and patching.
     """
-    yaml_files = get_yaml_files(directory)
+    # Only parse files that can declare an Application[Set]
+    yaml_files = get_application_yaml_files(directory)
     resources = parse_yaml(yaml_files)
     applications = get_applications(resources, selector)
     return patch_applications(applications)
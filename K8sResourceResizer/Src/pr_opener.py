@@ -1,27 +1,54 @@
+import io
 import os
-import json
+import functools
+import orjson
 import re
 import boto3
 import subprocess
 from github import Github
 from git import Repo, GitCommandError
-from prompt_creator import get_updated_file_paths, get_updated_file_paths_relative, get_updated_file_contents
 import yaml
 from logger import logger
 import shutil
 
+def link_or_copy_file(src, dst):
+    """
+    Place the contents of src at dst, hardlinking when both are on the same filesystem
+    and falling back to a content-only copy (git ignores the file metadata anyway)
+    """
+    try:
+        try:
+            os.remove(dst)
+        except FileNotFoundError:
+            pass
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+# Constant part of the Bedrock request body; only the messages change per call
+BEDROCK_REQUEST_TEMPLATE = {
+    "anthropic_version": "bedrock-2023-05-31",
+    "max_tokens": 10000,  # Adjust the token limit as needed
+    "temperature": 0.5,
+    "top_p": 0.9
+}
+
+@functools.lru_cache(maxsize=4)
+def _bedrock_client(region):
+    """
+    Return a bedrock-runtime client for the region, reused so its connection pool stays warm
+    """
+    return boto3.client(service_name='bedrock-runtime', region_name=region)
+
 def invoke_bedrock_model(prompt, region):
     """
     Invoke the bedrock model to generate the pull request description
     """
-    brt = boto3.client(service_name='bedrock-runtime', region_name=region)
+    brt = _bedrock_client(region)
     
     # Construct the request body with the correct parameters
-    body = json.dumps({
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 10000,  # Adjust the token limit as needed
-        "temperature": 0.5,
-        "top_p": 0.9,
+    body = orjson.dumps({
+        **BEDROCK_REQUEST_TEMPLATE,
         "messages": [
             {
                 "role": "user",
@@ -36,41 +63,56 @@ def invoke_bedrock_model(prompt, region):
 
     contentType = 'application/json'
 
-    # Send the request
-    response = brt.invoke_model(body=body, modelId=modelId, accept=accept, contentType=contentType)
+    # Stream the response so text is collected while the rest is still being generated
+    response = brt.invoke_model_with_response_stream(body=body, modelId=modelId, accept=accept, contentType=contentType)
     
-    # Parse the response
-    response_body = json.loads(response.get('body').read())
-
-    # Retrieve the generated content from the "content" field
-    generated_content = response_body.get('content', [])
-    if generated_content and isinstance(generated_content, list):
-        return generated_content[0].get('text')  # Access the "text" within the first content item if it exists
-    else:
-        return None
+    # Concatenate the text deltas of the streamed content blocks
+    generated_text = io.StringIO()
+    for event in response.get('body', []):
+        chunk = event.get('chunk')
+        if not chunk:
+            continue
+        payload = orjson.loads(chunk['bytes'])
+        if payload.get('type') == 'content_block_delta':
+            generated_text.write(payload.get('delta', {}).get('text', ''))
+    
+    return generated_text.getvalue() or None
     
 def delete_local_repo(local_dir):
     """
     Delete local directory of the repository if already exists
     """
-    if os.path.exists(local_dir):
-        # Use shutil instead of os.system/subprocess for directory removal
-        shutil.rmtree(local_dir, ignore_errors=True)
+    # Use shutil instead of os.system/subprocess for directory removal; a missing directory is a no-op
+    shutil.rmtree(local_dir, ignore_errors=True)
 
-def create_github_pull_request(repository_name, source_branch, destination_branch, title, description):
+@functools.lru_cache(maxsize=1)
+def _github_client():
     """
-    Create pull request based on the new remote branch pushed
+    Return the GitHub client, validating the token on first use
     """
     # Use the GitHub token from environment variables
     github_token = os.environ.get('GIT_TOKEN')
     if not github_token:
         raise ValueError("GITHUB_TOKEN environment variable is not set")
-    
-    g = Github(github_token)
+    return Github(github_token)
+
+@functools.lru_cache(maxsize=32)
+def _github_repo(repository_name):
+    """
+    Return the PyGithub handle for a repository, fetched once per repository
+    """
+    return _github_client().get_repo(repository_name)
+
+def create_github_pull_request(repository_name, source_branch, destination_branch, title, description):
+    """
+    Create pull request based on the new remote branch pushed
+    """
+    # Fail fast on a missing token before any API call
+    _github_client()
     
     try:
         # Get the repository
-        repo = g.get_repo(repository_name)
+        repo = _github_repo(repository_name)
         
         # Create the pull request
         pr = repo.create_pull(
@@ -86,25 +128,33 @@ def create_github_pull_request(repository_name, source_branch, destination_branc
         logger.info(f"Error creating pull request: {e}")
         return None
 
-def clone_github_repo(repo_url, local_dir):
+def clone_github_repo(repo_url, local_dir, branch=None):
     """
     Clone remote repository with manifests
+
+    Only the tip of the branch (default: the remote HEAD) is fetched, since the
+    workflow just edits a few files and pushes a new branch on top of it
     """
     try:
         # Ensure the target directory doesn't exist
-        if os.path.exists(local_dir):
+        if os.path.isdir(local_dir):
             logger.info(f"Directory {local_dir} already exists. Removing it.")
-            shutil.rmtree(local_dir, ignore_errors=True)  # Use shutil instead of subprocess
+        shutil.rmtree(local_dir, ignore_errors=True)  # Use shutil instead of subprocess
 
         git_bin = "/usr/bin/git"
 
-        # Clone the repository using full path
+        clone_args = [git_bin, "clone", "--depth", "1", "--filter=blob:none", "--single-branch"]
+        if branch:
+            clone_args += ["--branch", branch]
+
+        # Clone the repository using full path; never block on a credentials prompt
         subprocess.run(
-            [git_bin, "clone", repo_url, local_dir],
+            clone_args + [repo_url, local_dir],
             check=True,
             capture_output=True,
             text=True,
-            shell=False
+            shell=False,
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"}
         )
 
         logger.info(f"Repository successfully cloned into {local_dir}")
@@ -147,21 +197,21 @@ def commit_and_push_changes(recommendations, local_dir, branch_name, repo_url):
     origin.set_url(remote_url)
 
     # Set user name and email for Git commit
-    repo.config_writer().set_value("user", "name", "Resource Updater").release()
-    repo.config_writer().set_value("user", "email", "resource_updater@example.com").release()
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Resource Updater")
+        config.set_value("user", "email", "resource_updater@example.com")
 
-    updated_file_paths = get_updated_file_paths(recommendations)
-    updated_file_contents = get_updated_file_contents(recommendations)
-    updated_file_paths_relative = get_updated_file_paths_relative(recommendations)
-    
+    changed_paths = []
     for deployment in recommendations['metadata']['updated_deployments']:
         values_file_path_relative = deployment['updated_file'].split(f"/app/manifests/", 1)[1]
         # Directly copy the file content without YAML parsing
-        shutil.copy2(deployment['updated_file'], f"{local_dir}/{values_file_path_relative}")
-        
-        # Commit changes
-        repo.git.add(values_file_path_relative)
-        repo.git.commit('-m', 'Updating values with recommendations')
+        link_or_copy_file(deployment['updated_file'], f"{local_dir}/{values_file_path_relative}")
+        changed_paths.append(values_file_path_relative)
+
+    # Stage and commit all files at once instead of one git add/commit per file
+    if changed_paths:
+        repo.index.add(changed_paths)
+        repo.index.commit('Updating values with recommendations')
 
     # Push the new branch (optional, may require additional authentication setup)
     repo.git.push('origin', branch_name)
@@ -1,5 +1,11 @@
 from collections import defaultdict
+from functools import lru_cache
+import os
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 python_incontext_learning = """
 Example:
@@ -251,39 +257,57 @@ def build_model_prompt(recommendations, repo_name):
     Build the model prompt for Bedrock with inputs from recommendation, instructions, and updated manifest files
     """
 
-    updated_file_paths_relative = get_updated_file_paths_relative(recommendations)
-    updated_file_contents = get_updated_file_contents(recommendations)
+    _, updated_file_contents, updated_file_paths_relative = get_updated_artifacts(recommendations)
     
-    prompt = f"Application: {repo_name}\n\Recommendations:\n"
-    prompt += f"Recommendations: {recommendations}\n"
-    prompt += f"- Updated kubernetes manifest file location: {updated_file_paths_relative}\n"
-    prompt += f"  Updated kubernetes manifest file content: {updated_file_contents}\n"
-    prompt += f"Analyze the recommendations and the updated kubernetes manifest files with the new resource usage values according to the example and instructions below.\n"
-    
-    return prompt
+    # Build the prompt in one join rather than re-copying it on every +=
+    return "".join((
+        f"Application: {repo_name}\n\Recommendations:\n",
+        f"Recommendations: {recommendations}\n",
+        f"- Updated kubernetes manifest file location: {updated_file_paths_relative}\n",
+        f"  Updated kubernetes manifest file content: {updated_file_contents}\n",
+        "Analyze the recommendations and the updated kubernetes manifest files with the new resource usage values according to the example and instructions below.\n",
+    ))
+
+@lru_cache(maxsize=512)
+def _load_yaml(path, mtime):
+    # mtime is part of the cache key so an edited file is parsed again
+    with open(path, 'rb') as file:
+      return yaml.load(file, Loader=SafeLoader)
+
+def load_yaml_file(path):
+    """
+    Parse a manifest, reusing the previous result while the file is unchanged
+    """
+    return _load_yaml(path, os.path.getmtime(path))
 
 def get_updated_file_paths(recommendations):
-    # Initialize an empty list to store the values
-    updated_file_paths = []
-    for deployment in recommendations['metadata']['updated_deployments']:
-      updated_file_paths.append(deployment['updated_file'])
-    
-    return updated_file_paths
+    return [deployment['updated_file'] for deployment in recommendations['metadata']['updated_deployments']]
 
 def get_updated_file_paths_relative(recommendations):
-    # Initialize an empty list to store the values
-    updated_file_paths_relative = []
-    for deployment in recommendations['metadata']['updated_deployments']:
-      values_file_path_relative = deployment['updated_file'].split(f"/app/manifests/", 1)[1]
-      updated_file_paths_relative.append(values_file_path_relative)
-    
-    return updated_file_paths_relative
+    # partition() returns the tail directly, without building a list per path
+    return [
+      deployment['updated_file'].partition("/app/manifests/")[2]
+      for deployment in recommendations['metadata']['updated_deployments']
+    ]
 
 def get_updated_file_contents(recommendations):
     # Initialize an empty list to store the values
     updated_file_content = []
     for deployment in recommendations['metadata']['updated_deployments']: 
-      with open(deployment['updated_file'], 'r') as file:
-        updated_file_content.append(yaml.safe_load(file))
+      updated_file_content.append(load_yaml_file(deployment['updated_file']))
+
+    return updated_file_content
+
+def get_updated_artifacts(recommendations):
+    """
+    Walk the updated deployments once and return (paths, contents, relative paths)
+    """
+    updated_file_paths = []
+    updated_file_content = []
+    updated_file_paths_relative = []
+    for deployment in recommendations['metadata']['updated_deployments']:
+      updated_file_paths.append(deployment['updated_file'])
+      updated_file_content.append(load_yaml_file(deployment['updated_file']))
+      updated_file_paths_relative.append(deployment['updated_file'].partition("/app/manifests/")[2])
 
-    return updated_file_content
\ No newline at end of file
+    return updated_file_paths, updated_file_content, updated_file_paths_relative
@@ -8,18 +8,25 @@ This module provides functionality to:
 """
 
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import json
-import os
 from severity import Severity
 from logger import logger
 from typing import Optional
-from amp_client import AMP
-from utils import handle_exceptions, ensure_directory_exists
+from amp_client import AMP, MAX_CONCURRENT_QUERIES, pod_selector
+from utils import handle_exceptions
 from strategy import BasicStrategy
 
+# Recommendations have no current value to compare with, so every value is
+# reported as WARNING; stored by name so JSON output stays a string
+_NO_BASELINE_SEVERITY = Severity.WARNING.name
+
+# Every container runs its CPU and memory queries in parallel, so this many
+# containers in flight keep AMP at MAX_CONCURRENT_QUERIES requests
+DEFAULT_RECOMMENDATION_WORKERS = MAX_CONCURRENT_QUERIES // 2
+
 class ResourceOptimizer:
-    def __init__(self, workspace_id: str, region: str, strategy: 'BasicStrategy'):
+    def __init__(self, workspace_id: str, region: str, strategy: 'BasicStrategy', max_workers: Optional[int] = None):
         """
         Initialize the resource optimizer.
         
@@ -27,10 +34,12 @@ class ResourceOptimizer:
             workspace_id: AMP workspace ID
             region: AWS region
             strategy: Strategy instance for generating recommendations
+            max_workers: Containers processed concurrently (default: DEFAULT_RECOMMENDATION_WORKERS)
         """
         logger.info("Initializing resource optimizer")
         self.amp = AMP(workspace_id, region)
         self.strategy = strategy
+        self.max_workers = max(1, max_workers or DEFAULT_RECOMMENDATION_WORKERS)
         logger.info(f"Successfully initialized resource optimizer with strategy: {strategy.__class__.__name__}")
 
     @handle_exceptions
@@ -65,17 +74,20 @@ class ResourceOptimizer:
         logger.debug(f"Using time window of {history_hours} hours")
         logger.debug(f"Time range: from {start_time} to {end_time}")
         
+        # Escaped pod matcher, built once per deployment and shared by both queries
+        pods = pod_selector((deployment,))
+        
         # CPU usage query with rate over 5m to smooth spikes
         cpu_query = f'''sum(rate(container_cpu_usage_seconds_total{{
             namespace="{namespace}",
-            pod=~"{deployment}-[a-z0-9]+-[a-z0-9]+",
+            pod=~"{pods}",
             container="{container}"
         }}[5m])) by (container)'''
         
         # Memory usage query
         memory_query = f'''sum(container_memory_working_set_bytes{{
             namespace="{namespace}",
-            pod=~"{deployment}-[a-z0-9]+-[a-z0-9]+",
+            pod=~"{pods}",
             container="{container}"
         }}) by (container)'''
         
@@ -83,34 +95,26 @@ class ResourceOptimizer:
         start_timestamp = int(start_time.timestamp())
         end_timestamp = int(end_time.timestamp())
         
-        # Get historical data
-        cpu_data = self.amp.query_range(
-            query=cpu_query,
-            start=start_timestamp,
-            end=end_timestamp,
-            step='5m'
-        )
-        
-        memory_data = self.amp.query_range(
-            query=memory_query,
+        # Get historical data, CPU and memory in flight together
+        cpu_data, memory_data = self.amp.query_range_many(
+            [cpu_query, memory_query],
             start=start_timestamp,
             end=end_timestamp,
             step='5m'
         )
         
-        # Extract values and timestamps
-        cpu_samples = []
-        memory_samples = []
-        timestamps = []
+        # Extract values and timestamps (already parsed into arrays by the AMP client)
+        cpu_samples = np.empty(0)
+        memory_samples = np.empty(0)
+        timestamps = np.empty(0)
         
         if cpu_data.get('data', {}).get('result'):
-            for point in cpu_data['data']['result'][0]['values']:
-                timestamps.append(float(point[0]))
-                cpu_samples.append(float(point[1]))
+            series = cpu_data['data']['result'][0]
+            timestamps = series['np_ts']
+            cpu_samples = series['np_values']
                 
         if memory_data.get('data', {}).get('result'):
-            for point in memory_data['data']['result'][0]['values']:
-                memory_samples.append(float(point[1]))
+            memory_samples = memory_data['data']['result'][0]['np_values']
                 
         return {
             'cpu_samples': cpu_samples,
@@ -118,23 +122,6 @@ class ResourceOptimizer:
             'timestamps': timestamps
         }
 
-    def _determine_severity(self, current: Optional[float], recommended: Optional[float]) -> Severity:
-        """Determine severity level based on difference between current and recommended values."""
-        if current is None and recommended is None:
-            return Severity.GOOD
-        if current is None or recommended is None:
-            return Severity.WARNING
-
-        diff = abs(current - recommended) / current
-        if diff >= 0.5:  # 50% difference
-            return Severity.CRITICAL
-        elif diff >= 0.25:  # 25% difference
-            return Severity.WARNING
-        elif diff >= 0.1:  # 10% difference
-            return Severity.OK
-        else:
-            return Severity.GOOD
-
     def _validate_cpu_request(self, cpu_cores: float) -> float:
         """Validate CPU request according to K8s best practices."""
         # Minimum of 10m (0.01 cores)
@@ -179,6 +166,68 @@ class ResourceOptimizer:
         
         return self._validate_memory_request(limit)
 
+    def _recommend_for_container(self, namespace: str, name: str, container: str) -> tuple:
+        """
+        Compute the recommendation of a single container.
+        
+        Args:
+            namespace: Namespace of the deployment
+            name: Name of the deployment
+            container: Name of the container
+            
+        Returns:
+            tuple: (container key, recommendation) as stored in generate_recommendations
+        """
+        usage = self.get_historical_usage(namespace, name, container)
+        config = self.strategy.config
+        cpu_samples = usage['cpu_samples']
+        memory_samples = usage['memory_samples']
+        
+        # Calculate and validate requests; containers without metrics get the
+        # strategy minimum directly instead of a round trip through the strategy
+        cpu_request = self._validate_cpu_request(
+            self.strategy.calculate_cpu_request(cpu_samples, usage['timestamps'])
+            if len(cpu_samples) else config.min_cpu_cores
+        )
+        memory_request = self._validate_memory_request(
+            self.strategy.calculate_memory_request(memory_samples, usage['timestamps'])
+            if len(memory_samples) else config.min_memory_bytes
+        )
+        
+        # Calculate limits based on validated requests
+        cpu_limit = self._calculate_cpu_limit(cpu_request)
+        memory_limit = self._calculate_memory_limit(memory_request)
+        
+        return f"{namespace}/{name}/{container}", {
+            'object': {
+                'namespace': namespace,
+                'name': name,
+                'container': container
+            },
+            'recommended': {
+                'requests': {
+                    'cpu': {
+                        'value': cpu_request,
+                        'severity': _NO_BASELINE_SEVERITY
+                    },
+                    'memory': {
+                        'value': memory_request,
+                        'severity': _NO_BASELINE_SEVERITY
+                    }
+                },
+                'limits': {
+                    'cpu': {
+                        'value': cpu_limit,
+                        'severity': _NO_BASELINE_SEVERITY
+                    },
+                    'memory': {
+                        'value': memory_limit,
+                        'severity': _NO_BASELINE_SEVERITY
+                    }
+                }
+            }
+        }
+
     @handle_exceptions
     def generate_recommendations(self) -> dict:
         """Generate resource recommendations using the configured strategy."""
@@ -187,79 +236,26 @@ class ResourceOptimizer:
         # Get all deployments
         deployments = self.get_deployments()
         
-        # Get recommendations for each deployment
-        recommendations = {}
+        # Discover the containers of every deployment with a few batched queries
+        containers_by_deployment = self.amp.get_containers_bulk(deployments)
+        
+        # Flatten into (namespace, deployment, container) targets
+        targets = []
         for deployment in deployments:
             namespace = deployment['namespace']
             name = deployment['name']
-            deployment_key = f"{namespace}/{name}"
-            
-            # Get containers in deployment
-            query = f'''kube_pod_container_info{{
-                namespace="{namespace}",
-                pod=~"{name}-[a-z0-9]+-[a-z0-9]+"
-            }}'''
-            result = self.amp.query(query)
-            
-            containers = list({
-                container['metric']['container']
-                for container in result['data']['result']
-            })
-            
+            containers = containers_by_deployment.get((namespace, name), [])
             logger.info(f"Found {len(containers)} containers in deployment {name}")
-            
-            # Get recommendations for each container
-            for container in containers:
-                usage = self.get_historical_usage(namespace, name, container)
-                
-                # Calculate and validate requests
-                cpu_request = self._validate_cpu_request(
-                    self.strategy.calculate_cpu_request(
-                        usage['cpu_samples'],
-                        usage['timestamps']
-                    )
-                )
-                memory_request = self._validate_memory_request(
-                    self.strategy.calculate_memory_request(
-                        usage['memory_samples'],
-                        usage['timestamps']
-                    )
-                )
-                
-                # Calculate limits based on validated requests
-                cpu_limit = self._calculate_cpu_limit(cpu_request)
-                memory_limit = self._calculate_memory_limit(memory_request)
-                
-                container_key = f"{deployment_key}/{container}"
-                recommendations[container_key] = {
-                    'object': {
-                        'namespace': namespace,
-                        'name': name,
-                        'container': container
-                    },
-                    'recommended': {
-                        'requests': {
-                            'cpu': {
-                                'value': cpu_request,
-                                'severity': self._determine_severity(None, cpu_request)
-                            },
-                            'memory': {
-                                'value': memory_request,
-                                'severity': self._determine_severity(None, memory_request)
-                            }
-                        },
-                        'limits': {
-                            'cpu': {
-                                'value': cpu_limit,
-                                'severity': self._determine_severity(None, cpu_limit)
-                            },
-                            'memory': {
-                                'value': memory_limit,
-                                'severity': self._determine_severity(None, memory_limit)
-                            }
-                        }
-                    }
-                }
+            targets.extend((namespace, name, container) for container in containers)
+        
+        # Fetch the usage and compute the recommendation of every container concurrently.
+        # What overlaps is the AMP HTTP I/O (and Prophet's cmdstan subprocesses); the
+        # strategy math is mostly pandas and Python code holding the GIL, so more
+        # workers help with I/O latency, not CPU-bound work
+        recommendations = {}
+        with ThreadPoolExecutor(max_workers=min(len(targets), self.max_workers) or 1) as executor:
+            for container_key, recommendation in executor.map(lambda target: self._recommend_for_container(*target), targets):
+                recommendations[container_key] = recommendation
         
         logger.info(f"Generated recommendations for {len(recommendations)} containers")
         return recommendations
@@ -276,12 +272,8 @@ class ResourceOptimizer:
         Returns:
             dict: Structured recommendations data with metadata
         """
-        # Get strategy description from docstring
-        if self.strategy.__doc__:
-            paragraphs = [p.strip() for p in self.strategy.__doc__.split('\n\n') if p.strip()]
-            strategy_description = paragraphs[0] if paragraphs else ""
-        else:
-            strategy_description = ""
+        # Get strategy description from docstring (parsed once by the strategy)
+        strategy_description = self.strategy.description
         
         # Create metadata section
         metadata = {
@@ -296,7 +288,7 @@ class ResourceOptimizer:
                     "business_hours": {
                         "start": self.strategy.config.business_hours_start,
                         "end": self.strategy.config.business_hours_end,
-                        "days": self.strategy.config.business_days
+                        "days": sorted(self.strategy.config.business_days)
                     }
                 }
             },
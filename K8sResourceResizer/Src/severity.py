@@ -6,12 +6,15 @@ This module defines the severity levels used to indicate:
 2. WARNING - Significant resource misalignment (25-50% difference)
 3. OK - Minor resource misalignment (10-25% difference)
 4. GOOD - Resources well aligned (<10% difference)
+
+Levels are ranked integers (higher is more severe), so they compare and hash
+as small ints. Serialized output uses the level name, e.g. Severity.WARNING.name.
 """
 
-from enum import Enum
+from enum import IntEnum
 
-class Severity(str, Enum):
-    CRITICAL = "CRITICAL"
-    WARNING = "WARNING"
-    OK = "OK"
-    GOOD = "GOOD" 
\ No newline at end of file
+class Severity(IntEnum):
+    CRITICAL = 3
+    WARNING = 2
+    OK = 1
+    GOOD = 0 
\ No newline at end of file
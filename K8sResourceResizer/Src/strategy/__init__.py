@@ -2,9 +2,10 @@
 Strategy module for resource optimization.
 """
 
+import importlib
 from enum import Enum
 from dataclasses import dataclass
-from typing import List
+from typing import FrozenSet
 
 class RecommendationStrategy(Enum):
     BASIC = "basic"
@@ -19,7 +20,7 @@ class RecommendationStrategy(Enum):
     PROPHET = "prophet"
     ENSEMBLE = "ensemble"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RecommendationConfig:
     strategy: RecommendationStrategy
     cpu_percentile: float = 95.0
@@ -28,7 +29,7 @@ class RecommendationConfig:
     min_memory_bytes: float = 100 * 1024 * 1024  # 100Mi
     business_hours_start: int = 9
     business_hours_end: int = 17
-    business_days: List[int] = (0, 1, 2, 3, 4)  # Monday = 0
+    business_days: FrozenSet[int] = frozenset((0, 1, 2, 3, 4))  # Monday = 0
     trend_threshold: float = 0.1
     high_variance_threshold: float = 0.5
     history_window_hours: int = 24  # Default to 24 hours of historical data
@@ -40,9 +41,21 @@ from .time_aware_strategy import TimeAwareStrategy
 from .trend_aware_strategy import TrendAwareStrategy
 from .workload_aware_strategy import WorkloadAwareStrategy
 from .adaptive_strategy import AdaptiveStrategy
-from .quantile_regression_strategy import QuantileRegressionStrategy
 from .moving_average_strategy import MovingAverageStrategy
-from .pmdarima_strategy import PMDARIMAStrategy
-from .prophet_strategy import ProphetStrategy
-from .ensemble_strategy import EnsembleStrategy
-from .strategy_factory import StrategyFactory 
\ No newline at end of file
+from .strategy_factory import StrategyFactory
+
+# Strategies pulling in pmdarima or Prophet, or compiling a solver at import, are
+# imported on first access (PEP 562), so runs that don't use them skip that cost
+_LAZY_STRATEGIES = {
+    'QuantileRegressionStrategy': '.quantile_regression_strategy',
+    'PMDARIMAStrategy': '.pmdarima_strategy',
+    'ProphetStrategy': '.prophet_strategy',
+    'EnsembleStrategy': '.ensemble_strategy',
+}
+
+def __getattr__(name):
+    if name in _LAZY_STRATEGIES:
+        strategy_class = getattr(importlib.import_module(_LAZY_STRATEGIES[name], __name__), name)
+        globals()[name] = strategy_class
+        return strategy_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
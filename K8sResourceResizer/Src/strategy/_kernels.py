@@ -0,0 +1,336 @@
+"""
+Numeric kernels shared by the recommendation strategies.
+
+The kernels are written against the subset of NumPy that Numba understands:
+1. With Numba installed (the optional `jit` extra) they are compiled with
+   @njit(cache=True, nogil=True) on first use, so they also run in parallel
+   on the thread pools of the optimizer and the ensemble
+2. Without it the very same functions run as plain NumPy code, except for
+   kernels written as per-sample loops (see _loop_kernel), which are replaced
+   by vectorized pandas/NumPy implementations returning the same results
+
+All kernels expect contiguous float64 arrays, see as_float_array().
+"""
+
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _jit(func):
+    """Compile func with Numba when it is available, otherwise return it unchanged."""
+    if njit is None:
+        return func
+    return njit(cache=True, nogil=True)(func)
+
+
+def _loop_kernel(fallback):
+    """
+    Decorator for kernels written as explicit per-sample loops, which only pay off
+    compiled: with Numba the kernel is compiled, without it the vectorized fallback
+    is used instead of running the loops in the interpreter.
+    """
+    def decorate(func):
+        return fallback if njit is None else _jit(func)
+    return decorate
+
+
+def _trailing_windows(samples, window) -> np.ndarray:
+    """(n, window) view of the trailing window of every sample, front-padded with NaN."""
+    padded = np.concatenate((np.full(window - 1, np.nan), samples))
+    return np.lib.stride_tricks.sliding_window_view(padded, window)
+
+
+def _ewma_last_vectorized(samples, alphas) -> np.ndarray:
+    """ewma_last() without Numba: pandas' own ewm(alpha=a, adjust=False) per alpha."""
+    ewm = pd.Series(samples)
+    return np.array([ewm.ewm(alpha=alpha, adjust=False).mean().iloc[-1] for alpha in alphas])
+
+
+def _rolling_mean_vectorized(samples, window) -> np.ndarray:
+    """rolling_mean() without Numba, summing all trailing windows at once."""
+    counts = np.minimum(np.arange(1, samples.size + 1), window)
+    return np.nansum(_trailing_windows(samples, window), axis=1) / counts
+
+
+def _workload_stats_vectorized(samples, window) -> tuple:
+    """workload_stats() without Numba, with the rolling std of all trailing windows at once."""
+    n = samples.size
+    windows = _trailing_windows(samples, window)
+    counts = np.minimum(np.arange(1, n + 1), window)
+    means = np.nansum(windows, axis=1) / counts
+    deviations = windows - means[:, None]
+    # The std of the first sample is undefined and skipped, as in the kernel
+    stds = np.sqrt(np.nansum(deviations[1:] * deviations[1:], axis=1) / (counts[1:] - 1))
+    mean = means.mean()
+    std = stds.mean() if n > 1 else np.nan
+    cv = std / mean if mean != 0 else 0.0
+    return cv, np.sum(samples > mean + 2 * std) / n
+
+
+def as_float_array(values) -> np.ndarray:
+    """Convert a list or array of samples to the contiguous float64 array the kernels expect."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+@_jit
+def _rank(n, q):
+    """Lower/upper order-statistic indices and interpolation fraction of the q-th percentile."""
+    position = (n - 1) * q / 100.0
+    lower = int(np.floor(position))
+    return lower, min(lower + 1, n - 1), position - lower
+
+
+@_jit
+def _interpolate(partitioned, lower, upper, fraction):
+    """Linear interpolation between two order statistics (NumPy's default percentile method)."""
+    return partitioned[lower] + (partitioned[upper] - partitioned[lower]) * fraction
+
+
+@_jit
+def percentile(samples, q):
+    """q-th percentile of non-empty samples via an O(n) partition instead of a sort."""
+    lower, upper, fraction = _rank(samples.size, q)
+    partitioned = np.partition(samples, np.array([lower, upper]))
+    return _interpolate(partitioned, lower, upper, fraction)
+
+
+@_jit
+def cpu_stats(samples):
+    """Return (p95, p99) of non-empty samples from a single partition."""
+    lower95, upper95, fraction95 = _rank(samples.size, 95.0)
+    lower99, upper99, fraction99 = _rank(samples.size, 99.0)
+    partitioned = np.partition(samples, np.array([lower95, upper95, lower99, upper99]))
+    return (_interpolate(partitioned, lower95, upper95, fraction95),
+            _interpolate(partitioned, lower99, upper99, fraction99))
+
+
+@_jit
+def mem_stats(samples):
+    """Return (peak, p95) of non-empty samples from a single partition."""
+    n = samples.size
+    lower, upper, fraction = _rank(n, 95.0)
+    partitioned = np.partition(samples, np.array([lower, upper, n - 1]))
+    return partitioned[n - 1], _interpolate(partitioned, lower, upper, fraction)
+
+
+@_jit
+def linear_slope(samples):
+    """
+    Closed-form least-squares slope of samples against their index 0..n-1.
+
+    With the index centred, sum(x) is 0 so the covariance reduces to a dot
+    product, and sum(x^2) has the closed form n(n^2 - 1)/12.
+    """
+    n = samples.size
+    if n < 2:
+        return 0.0
+    centred_x = np.arange(n) - (n - 1) / 2.0
+    return np.dot(centred_x, samples) / (n * (n * n - 1) / 12.0)
+
+
+@_jit
+def business_hours_mask(timestamps, start_hour, end_hour, is_business_day):
+    """
+    Boolean mask of the timestamps (Unix seconds, UTC) that fall on a business day
+    between start_hour and end_hour inclusive, using plain integer arithmetic.
+    is_business_day is a 7-element boolean table indexed by weekday (Monday = 0).
+    """
+    seconds = timestamps.astype(np.int64)
+    hour = (seconds // 3600) % 24
+    weekday = (seconds // 86400 + 3) % 7  # 1970-01-01 was a Thursday
+    return (hour >= start_hour) & (hour <= end_hour) & is_business_day[weekday]
+
+
+def local_hour_and_weekday(timestamps, tz_name: str) -> tuple:
+    """
+    Local hour of day and weekday (Monday = 0) of Unix timestamps in the time zone tz_name.
+
+    The UTC offset is looked up once per distinct UTC hour, as zone transitions
+    fall on hour boundaries, and applied with integer arithmetic; this matches
+    pandas' tz_convert without building a DatetimeIndex.
+    """
+    seconds = as_float_array(timestamps).astype(np.int64)
+    utc_hours, inverse = np.unique(seconds // 3600, return_inverse=True)
+    zone = ZoneInfo(tz_name)
+    offsets = np.array([
+        datetime.fromtimestamp(hour * 3600, timezone.utc).astimezone(zone).utcoffset().total_seconds()
+        for hour in utc_hours.tolist()
+    ], dtype=np.int64)
+    local_seconds = seconds + offsets[inverse]
+    return (local_seconds // 3600) % 24, (local_seconds // 86400 + 3) % 7  # 1970-01-01 was a Thursday
+
+
+def ewma_alphas(spans) -> np.ndarray:
+    """Smoothing factors for EWMA spans, derived like pandas (alpha = 1 / (1 + com), com = (span - 1) / 2)."""
+    return np.array([1.0 / (1.0 + (span - 1) / 2.0) for span in spans])
+
+
+@_loop_kernel(_ewma_last_vectorized)
+def ewma_last(samples, alphas):
+    """
+    Last value of pandas' ewm(alpha=a, adjust=False).mean() for every a in alphas,
+    from a single pass over non-empty samples.
+
+    Follows the pandas recursion step by step (including NaN gaps), so results
+    match Series.ewm bit for bit.
+    """
+    k = alphas.size
+    weighted = np.full(k, samples[0])
+    old_weight = np.ones(k)
+    for i in range(1, samples.size):
+        current = samples[i]
+        is_observation = current == current
+        for j in range(k):
+            if weighted[j] == weighted[j]:
+                old_weight[j] *= 1.0 - alphas[j]
+                if is_observation:
+                    if weighted[j] != current:
+                        weighted[j] = ((old_weight[j] * weighted[j]) + (alphas[j] * current)) / (old_weight[j] + alphas[j])
+                    old_weight[j] = 1.0
+            elif is_observation:
+                weighted[j] = current
+    return weighted
+
+
+@_jit
+def tail_std(samples, window):
+    """Sample standard deviation (ddof=1) of the last window samples, NaN below two samples."""
+    n = samples.size
+    if window < 2 or n < window:
+        return np.nan
+    tail = samples[n - window:]
+    mean = tail.sum() / window
+    deviations = tail - mean
+    return np.sqrt(np.dot(deviations, deviations) / (window - 1))
+
+
+@_jit
+def ewma_and_tail_std(samples, alphas, window):
+    """ewma_last(samples, alphas) and tail_std(samples, window) from a single kernel call."""
+    return ewma_last(samples, alphas), tail_std(samples, window)
+
+
+@_jit
+def quantreg_irls(exog, endog, q, max_iter=1000, p_tol=1e-6):
+    """
+    Coefficients of the q-th quantile regression of endog on exog.
+
+    Same iteratively reweighted least squares as statsmodels' QuantReg.fit
+    (including its residual clamping and cycle check), without the
+    covariance and results bookkeeping that is never read.
+    """
+    k = exog.shape[1]
+    xstar = exog
+    beta = np.ones(k)
+    history = np.empty((max_iter, k))
+    diff = 10.0
+    n_iter = 0
+    while n_iter < max_iter and diff > p_tol:
+        beta0 = beta
+        beta = np.dot(np.linalg.pinv(np.dot(xstar.T, exog)), np.dot(xstar.T, endog))
+        resid = endog - np.dot(exog, beta)
+        resid = np.where(np.abs(resid) < 0.000001, np.where(resid >= 0, 0.000001, -0.000001), resid)
+        resid = np.abs(np.where(resid < 0, q * resid, (1 - q) * resid))
+        xstar = exog / resid.reshape(-1, 1)
+        diff = np.max(np.abs(beta - beta0))
+        history[n_iter] = beta
+        n_iter += 1
+
+        if n_iter >= 300 and n_iter % 100 == 0:
+            # Convergence cycle, should not happen
+            cycle = False
+            for back in range(2, 10):
+                if np.all(beta == history[n_iter - back]):
+                    cycle = True
+                    break
+            if cycle:
+                break
+    return beta
+
+
+@_loop_kernel(_rolling_mean_vectorized)
+def rolling_mean(samples, window):
+    """Trailing mean over up to window samples, like pandas' rolling(window, min_periods=1).mean()."""
+    n = samples.size
+    means = np.empty(n)
+    for i in range(n):
+        start = max(0, i - window + 1)
+        means[i] = samples[start:i + 1].sum() / (i + 1 - start)
+    return means
+
+
+@_jit
+def trend_stats(samples, window):
+    """
+    Return (slope, mean, std) of at least two samples in a single kernel call:
+    the least-squares slope of their window rolling mean, and their mean and
+    sample standard deviation (ddof=1).
+    """
+    n = samples.size
+    mean = samples.sum() / n
+    deviations = samples - mean
+    std = np.sqrt(np.dot(deviations, deviations) / (n - 1))
+    return linear_slope(rolling_mean(samples, window)), mean, std
+
+
+@_loop_kernel(_workload_stats_vectorized)
+def workload_stats(samples, window):
+    """
+    Return (cv, spike_ratio) of non-empty samples from their window rolling statistics,
+    like pandas' rolling(window, min_periods=1):
+    cv is the mean rolling std over the mean rolling mean (0 for a zero mean), and
+    spike_ratio the fraction of samples above the mean rolling mean plus two mean rolling stds.
+    The rolling std of the first sample is undefined and left out, as pandas' mean() skips NaN.
+    """
+    n = samples.size
+    mean = rolling_mean(samples, window).mean()
+    std_sum = 0.0
+    for i in range(1, n):
+        start = max(0, i - window + 1)
+        tail = samples[start:i + 1]
+        deviations = tail - tail.sum() / (i + 1 - start)
+        std_sum += np.sqrt(np.dot(deviations, deviations) / (i - start))
+    std = std_sum / (n - 1) if n > 1 else np.nan
+    cv = std / mean if mean != 0 else 0.0
+    return cv, np.sum(samples > mean + 2 * std) / n
+
+
+def warm_up():
+    """
+    Compile the kernels (or load them from Numba's on-disk cache) at import, so the
+    first container does not pay for it. A no-op without Numba.
+
+    The solver in quantreg_irls is warmed up by its strategy module, which is only
+    imported when selected.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    samples = np.arange(1.0, 9.0)
+    alphas = ewma_alphas((6, 12))
+    try:
+        percentile(samples, 95.0)
+        cpu_stats(samples)
+        mem_stats(samples)
+        linear_slope(samples)
+        business_hours_mask(samples, 9, 17, np.ones(7, dtype=np.bool_))
+        ewma_last(samples, alphas)
+        tail_std(samples, 4)
+        ewma_and_tail_std(samples, alphas, 4)
+        rolling_mean(samples, 6)
+        trend_stats(samples, 6)
+        workload_stats(samples, 6)
+    except Exception:
+        # Compiled again on first use, which reports the error in context
+        pass
+
+
+warm_up()
@@ -1,7 +1,6 @@
-import numpy as np
-import pandas as pd
 from typing import List, Optional
 from .base_strategy import BaseStrategy
+from ._kernels import as_float_array, business_hours_mask, cpu_stats, mem_stats, linear_slope, percentile
 
 class AdaptiveStrategy(BaseStrategy):
     """
@@ -19,89 +18,80 @@ class AdaptiveStrategy(BaseStrategy):
     - Dynamically selects best approach based on usage characteristics
     """
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples:
-            return self.config.min_cpu_cores
+        min_cpu = self.config.min_cpu_cores
+        if not self._has_samples(cpu_samples):
+            return min_cpu
             
-        p95 = np.percentile(cpu_samples, 95)
-        p99 = np.percentile(cpu_samples, 99)
+        cpu_samples = as_float_array(cpu_samples)
+        p95, p99 = cpu_stats(cpu_samples)
         
-        # High variability check
-        if p99 / p95 > 2:
-            return max(p99 * 1.1, self.config.min_cpu_cores)
+        # High variability check (p99 / p95 > 2, without dividing by a zero p95)
+        if p99 > 2 * p95:
+            return max(p99 * 1.1, min_cpu)
             
-        # Check for time patterns if timestamps are provided
-        if timestamps:
+        # Check for time patterns if there are enough timestamps to compare
+        if self._has_series(timestamps):
             time_patterns = self._analyze_time_patterns(cpu_samples, timestamps)
             if time_patterns['has_business_hours_pattern']:
-                return max(time_patterns['business_hours_p95'] * 1.1, self.config.min_cpu_cores)
+                return max(time_patterns['business_hours_p95'] * 1.1, min_cpu)
         
         # Default to p95 with buffer
-        return max(p95 * 1.1, self.config.min_cpu_cores)
+        return max(p95 * 1.1, min_cpu)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples:
-            return self.config.min_memory_bytes
+        memory_buffer, min_memory = self.config.memory_buffer, self.config.min_memory_bytes
+        if not self._has_samples(memory_samples):
+            return min_memory
             
-        peak = max(memory_samples)
-        p95 = np.percentile(memory_samples, 95)
+        memory_samples = as_float_array(memory_samples)
+        peak, p95 = mem_stats(memory_samples)
         
         # Check for spiky behavior
         if peak > p95 * 2:
             # Use weighted average of peak and p95
-            return max((0.7 * peak + 0.3 * p95) * self.config.memory_buffer, 
-                      self.config.min_memory_bytes)
+            return max((0.7 * peak + 0.3 * p95) * memory_buffer, min_memory)
         
         # Check for growth trend
         trend = self._analyze_trends(memory_samples)
         if trend['trend'] == 'increasing':
-            return max(peak * (1 + trend['growth_rate']) * self.config.memory_buffer,
-                      self.config.min_memory_bytes)
+            return max(peak * (1 + trend['growth_rate']) * memory_buffer, min_memory)
         
         # Default to peak with buffer
-        return max(peak * self.config.memory_buffer, self.config.min_memory_bytes)
+        return max(peak * memory_buffer, min_memory)
 
     def _analyze_time_patterns(self, samples: List[float], timestamps: List[float]) -> dict:
-        df = pd.DataFrame({
-            'timestamp': pd.to_datetime(timestamps, unit='s'),
-            'value': samples
-        })
-        df['hour'] = df['timestamp'].dt.hour
-        df['day'] = df['timestamp'].dt.dayofweek
-
-        business_hours = df[
-            (df['hour'] >= self.config.business_hours_start) & 
-            (df['hour'] <= self.config.business_hours_end) & 
-            (df['day'].isin(self.config.business_days))
-        ]
-        
-        non_business = df[~(
-            (df['hour'] >= self.config.business_hours_start) & 
-            (df['hour'] <= self.config.business_hours_end) & 
-            (df['day'].isin(self.config.business_days))
-        )]
+        values = as_float_array(samples)
+        in_business_hours = business_hours_mask(
+            as_float_array(timestamps),
+            self.config.business_hours_start,
+            self.config.business_hours_end,
+            self._business_day_mask
+        )
+        business_hours = values[in_business_hours]
+        non_business = values[~in_business_hours]
         
-        business_mean = business_hours['value'].mean() if not business_hours.empty else 0
-        non_business_mean = non_business['value'].mean() if not non_business.empty else 0
+        business_mean = business_hours.mean() if business_hours.size else 0
+        non_business_mean = non_business.mean() if non_business.size else 0
+        has_pattern = abs(business_mean - non_business_mean) > business_mean * 0.2
         
+        # The business hours p95 is only read when there is a pattern
         return {
-            'has_business_hours_pattern': abs(business_mean - non_business_mean) > business_mean * 0.2,
-            'business_hours_p95': np.percentile(business_hours['value'], 95) if not business_hours.empty else 0,
-            'overall_p95': np.percentile(df['value'], 95)
+            'has_business_hours_pattern': has_pattern,
+            'business_hours_p95': percentile(business_hours, 95.0) if has_pattern and business_hours.size else 0
         }
 
     def _analyze_trends(self, samples: List[float]) -> dict:
-        if len(samples) < 2:
+        if not self._has_series(samples):
             return {'trend': 'stable', 'growth_rate': 0}
             
-        x = np.arange(len(samples))
-        y = np.array(samples)
-        slope, _ = np.polyfit(x, y, 1)
+        slope = linear_slope(as_float_array(samples))
         
         growth_rate = (slope * len(samples)) / samples[0] if samples[0] != 0 else 0
         
-        if growth_rate > self.config.trend_threshold:
+        threshold = self.config.trend_threshold
+        if growth_rate > threshold:
             trend = 'increasing'
-        elif growth_rate < -self.config.trend_threshold:
+        elif growth_rate < -threshold:
             trend = 'decreasing'
         else:
             trend = 'stable'
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
+import numpy as np
 from typing import List, Optional, Dict
 from . import RecommendationConfig
 
@@ -9,6 +11,26 @@ class BaseStrategy(ABC):
     """
     def __init__(self, config: RecommendationConfig):
         self.config = config
+        # The config is frozen, so derived primitives can be computed once:
+        # a weekday-indexed (Monday = 0) lookup table of the business days
+        self._business_day_mask = np.zeros(7, dtype=np.bool_)
+        self._business_day_mask[list(config.business_days)] = True
+
+    @cached_property
+    def description(self) -> str:
+        """First paragraph of the strategy's docstring, parsed once per instance."""
+        paragraphs = [p.strip() for p in (self.__doc__ or "").split('\n\n') if p.strip()]
+        return paragraphs[0] if paragraphs else ""
+
+    @staticmethod
+    def _has_samples(values) -> bool:
+        """Return True if values is a non-empty list or array (arrays have no truth value)."""
+        return values is not None and len(values) > 0
+
+    @staticmethod
+    def _has_series(values) -> bool:
+        """Return True if values holds at least two points, the minimum for trend or pattern analysis."""
+        return values is not None and len(values) > 1
 
     @abstractmethod
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
@@ -16,7 +38,7 @@ class BaseStrategy(ABC):
         Calculate the recommended CPU request based on usage samples.
         
         Args:
-            cpu_samples: List of CPU usage samples
+            cpu_samples: List or array of CPU usage samples
             timestamps: Optional list of timestamps for the samples
             
         Returns:
@@ -30,7 +52,7 @@ class BaseStrategy(ABC):
         Calculate the recommended memory request based on usage samples.
         
         Args:
-            memory_samples: List of memory usage samples in bytes
+            memory_samples: List or array of memory usage samples in bytes
             timestamps: Optional list of timestamps for the samples
             
         Returns:
@@ -1,6 +1,6 @@
-import numpy as np
 from typing import List, Optional
 from .base_strategy import BaseStrategy
+from ._kernels import as_float_array, percentile
 
 class BasicStrategy(BaseStrategy):
     """
@@ -24,10 +24,11 @@ class BasicStrategy(BaseStrategy):
         Returns:
             float: Recommended CPU request in cores
         """
-        if not cpu_samples:
+        if not self._has_samples(cpu_samples):
             return self.config.min_cpu_cores
             
-        p95 = np.percentile(cpu_samples, 95)
+        # O(n) partition-based percentile, same linear interpolation as np.percentile
+        p95 = percentile(as_float_array(cpu_samples), 95.0)
         safety_buffer = 1.1  # 10% safety buffer
         
         return max(p95 * safety_buffer, self.config.min_cpu_cores)
@@ -43,9 +44,9 @@ class BasicStrategy(BaseStrategy):
         Returns:
             float: Recommended memory request in bytes
         """
-        if not memory_samples:
+        if not self._has_samples(memory_samples):
             return self.config.min_memory_bytes
             
-        peak = max(memory_samples)
+        peak = as_float_array(memory_samples).max()
         
         return max(peak * self.config.memory_buffer, self.config.min_memory_bytes) 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict
 from .base_strategy import BaseStrategy
 from .basic_strategy import BasicStrategy
@@ -37,50 +38,57 @@ class EnsembleStrategy(BaseStrategy):
             'moving_average': MovingAverageStrategy(config),
             'prophet': ProphetStrategy(config)
         }
-        # Initial weights (equal weighting)
-        self.weights = {name: 1.0/len(self.strategies) for name in self.strategies.keys()}
+        # Sub-strategies are independent and mostly run in native NumPy/pandas/Stan
+        # code, so they are evaluated concurrently; threads are started on first use
+        self._executor = ThreadPoolExecutor(max_workers=len(self.strategies), thread_name_prefix='ensemble')
+        # Initial weights (equal weighting), aligned with the strategy order
+        self._names = tuple(self.strategies.keys())
+        self._weights = np.full(len(self._names), 1.0/len(self._names))
         self.prediction_history = []
 
-    def _get_weighted_prediction(self, predictions: Dict[str, float]) -> float:
+    @property
+    def weights(self) -> Dict[str, float]:
+        """Current weight of every strategy by name."""
+        return dict(zip(self._names, self._weights.tolist()))
+
+    def _predict_all(self, method_name: str, samples: List[float], timestamps: List[float], fallback: float) -> np.ndarray:
+        """
+        Run method_name of every strategy concurrently, using fallback for strategies that fail.
+        Returns the predictions as an array aligned with the strategy weights.
+        """
+        futures = [
+            self._executor.submit(getattr(self.strategies[name], method_name), samples, timestamps)
+            for name in self._names
+        ]
+        predictions = np.empty(len(futures))
+        for i, future in enumerate(futures):
+            try:
+                predictions[i] = future.result()
+            except Exception as e:
+                # If a strategy fails, use the minimum value
+                predictions[i] = fallback
+        return predictions
+
+    def _get_weighted_prediction(self, predictions: np.ndarray) -> float:
         """Calculate weighted average of predictions."""
-        return sum(
-            predictions[name] * self.weights[name]
-            for name in predictions.keys()
-        )
+        return float(predictions @ self._weights)
 
-    def _update_weights(self, actual: float, predictions: Dict[str, float]):
+    def _update_weights(self, actual: float, predictions: np.ndarray):
         """Update strategy weights based on prediction accuracy."""
-        errors = {
-            name: abs(pred - actual) / actual if actual != 0 else abs(pred)
-            for name, pred in predictions.items()
-        }
+        errors = np.abs(predictions - actual) / actual if actual != 0 else np.abs(predictions)
         # Convert errors to weights (lower error = higher weight)
-        total_error = sum(errors.values())
+        total_error = errors.sum()
         if total_error > 0:
-            new_weights = {
-                name: (1 - error/total_error) 
-                for name, error in errors.items()
-            }
+            new_weights = 1 - errors / total_error
             # Normalize weights
-            weight_sum = sum(new_weights.values())
-            self.weights = {
-                name: weight/weight_sum 
-                for name, weight in new_weights.items()
-            }
+            self._weights = new_weights / new_weights.sum()
 
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples or not timestamps:
+        if not self._has_samples(cpu_samples) or not self._has_samples(timestamps):
             return self.config.min_cpu_cores
             
         # Get predictions from all strategies
-        predictions = {}
-        for name, strategy in self.strategies.items():
-            try:
-                pred = strategy.calculate_cpu_request(cpu_samples, timestamps)
-                predictions[name] = pred
-            except Exception as e:
-                # If a strategy fails, use the minimum value
-                predictions[name] = self.config.min_cpu_cores
+        predictions = self._predict_all('calculate_cpu_request', cpu_samples, timestamps, self.config.min_cpu_cores)
         
         # Calculate weighted prediction
         weighted_pred = self._get_weighted_prediction(predictions)
@@ -89,18 +97,11 @@ class EnsembleStrategy(BaseStrategy):
         return max(weighted_pred * 1.1, self.config.min_cpu_cores)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples or not timestamps:
+        if not self._has_samples(memory_samples) or not self._has_samples(timestamps):
             return self.config.min_memory_bytes
             
         # Get predictions from all strategies
-        predictions = {}
-        for name, strategy in self.strategies.items():
-            try:
-                pred = strategy.calculate_memory_request(memory_samples, timestamps)
-                predictions[name] = pred
-            except Exception as e:
-                # If a strategy fails, use the minimum value
-                predictions[name] = self.config.min_memory_bytes
+        predictions = self._predict_all('calculate_memory_request', memory_samples, timestamps, self.config.min_memory_bytes)
         
         # Calculate weighted prediction
         weighted_pred = self._get_weighted_prediction(predictions)
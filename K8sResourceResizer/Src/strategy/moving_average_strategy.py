@@ -1,7 +1,21 @@
 import numpy as np
-import pandas as pd
+from functools import lru_cache
+from scipy import stats
 from typing import List, Optional
 from .base_strategy import BaseStrategy
+from ._kernels import as_float_array, ewma_alphas, ewma_and_tail_std
+
+# Smoothing factors of the EWMA windows (5-minute samples)
+CPU_EWMA_ALPHAS = ewma_alphas((6, 12, 24))  # 30-minute, 1-hour and 2-hour windows
+MEMORY_EWMA_ALPHAS = ewma_alphas((24, 48))  # 2-hour and 4-hour windows
+
+# Longest window of the rolling standard deviation (1 hour)
+ROLLING_STD_WINDOW = 12
+
+@lru_cache(maxsize=32)
+def _t_value(confidence: float, df: int) -> float:
+    """Two-sided t-distribution critical value, memoized per (confidence, degrees of freedom)."""
+    return stats.t.ppf((1 + confidence) / 2, df=df)
 
 class MovingAverageStrategy(BaseStrategy):
     """
@@ -13,56 +27,44 @@ class MovingAverageStrategy(BaseStrategy):
     - Calculates prediction intervals using rolling standard deviation
     - Adapts to trend changes using momentum indicators
     """
-    def _calculate_ewma(self, series: pd.Series, spans: List[int]) -> List[float]:
-        """Calculate exponential weighted moving averages for multiple spans."""
-        return [series.ewm(span=span, adjust=False).mean().iloc[-1] for span in spans]
-
-    def _calculate_prediction_interval(self, series: pd.Series, confidence: float = 0.95) -> float:
-        """Calculate prediction interval using rolling statistics."""
-        # Calculate rolling standard deviation
-        rolling_std = series.rolling(window=min(len(series), 12)).std().iloc[-1]
+    def _calculate_ewma_and_interval(self, samples: np.ndarray, alphas: np.ndarray, confidence: float = 0.95) -> tuple:
+        """
+        Calculate the latest exponential weighted moving averages for multiple spans and
+        the prediction interval from the latest rolling standard deviation, in one kernel call.
+        """
+        ewmas, rolling_std = ewma_and_tail_std(samples, alphas, min(samples.size, ROLLING_STD_WINDOW))
         # Use t-distribution for small samples
-        from scipy import stats
-        t_value = stats.t.ppf((1 + confidence) / 2, df=len(series)-1)
-        return rolling_std * t_value
+        return ewmas, rolling_std * _t_value(confidence, samples.size - 1)
 
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples:
+        if not self._has_samples(cpu_samples):
             return self.config.min_cpu_cores
             
-        # Convert to pandas series
-        series = pd.Series(cpu_samples)
-        
-        # Calculate multiple EWMAs
-        short_term = self._calculate_ewma(series, [6])[0]  # 30-minute window
-        medium_term = self._calculate_ewma(series, [12])[0]  # 1-hour window
-        long_term = self._calculate_ewma(series, [24])[0]  # 2-hour window
+        # Calculate multiple EWMAs (30-minute, 1-hour and 2-hour windows) and the prediction interval
+        values = as_float_array(cpu_samples)
+        (short_term, medium_term, long_term), prediction_interval = self._calculate_ewma_and_interval(values, CPU_EWMA_ALPHAS)
         
         # Weight the different terms (favor recent data)
         weighted_avg = 0.5 * short_term + 0.3 * medium_term + 0.2 * long_term
         
         # Add prediction interval
-        prediction_interval = self._calculate_prediction_interval(series)
         recommended = weighted_avg + prediction_interval
         
         return max(recommended * 1.1, self.config.min_cpu_cores)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples:
+        if not self._has_samples(memory_samples):
             return self.config.min_memory_bytes
             
-        # Convert to pandas series
-        series = pd.Series(memory_samples)
-        
-        # Calculate multiple EWMAs with longer windows for memory
-        medium_term = self._calculate_ewma(series, [24])[0]  # 2-hour window
-        long_term = self._calculate_ewma(series, [48])[0]  # 4-hour window
+        # Calculate multiple EWMAs with longer windows for memory (2-hour and 4-hour windows)
+        # and the prediction interval with higher confidence for memory
+        values = as_float_array(memory_samples)
+        (medium_term, long_term), prediction_interval = self._calculate_ewma_and_interval(values, MEMORY_EWMA_ALPHAS, confidence=0.99)
         
         # Weight the different terms (favor longer-term stability for memory)
         weighted_avg = 0.4 * medium_term + 0.6 * long_term
         
-        # Add prediction interval with higher confidence for memory
-        prediction_interval = self._calculate_prediction_interval(series, confidence=0.99)
+        # Add prediction interval
         recommended = weighted_avg + prediction_interval
         
         return max(recommended * self.config.memory_buffer, self.config.min_memory_bytes) 
\ No newline at end of file
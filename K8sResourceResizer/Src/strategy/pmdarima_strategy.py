@@ -2,15 +2,39 @@ import numpy as np
 import pandas as pd
 from typing import List, Optional
 from .base_strategy import BaseStrategy
-from pmdarima import auto_arima
+from ._kernels import as_float_array, percentile
+from pmdarima import ARIMA, auto_arima
 from pmdarima.arima.utils import ndiffs
 from loguru import logger
+import math
 import warnings
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 
 # Filter out specific scikit-learn deprecation warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
 
+def _bucket(value: float, significant_digits: int) -> float:
+    """Round value to the given number of significant digits (0, NaN and inf are kept as is)."""
+    if value == 0 or not math.isfinite(value):
+        return value
+    return round(value, significant_digits - 1 - int(math.floor(math.log10(abs(value)))))
+
+def _downsample(values: np.ndarray, freq: int) -> np.ndarray:
+    """
+    Every freq-th point of the trailing freq-point mean (NaNs skipped), i.e.
+    rolling(window=freq, min_periods=1).mean().iloc[::freq] without the rolling pass:
+    point 0 is the first value and point k averages values[(k - 1) * freq + 1 : k * freq + 1].
+    """
+    blocks = (values.size - 1) // freq
+    windows = values[1:1 + blocks * freq].reshape(blocks, freq)
+    observed = ~np.isnan(windows)
+    counts = observed.sum(axis=1)
+    sums = np.where(observed, windows, 0.0).sum(axis=1)
+    means = np.divide(sums, counts, out=np.full(blocks, np.nan), where=counts > 0)
+    return np.concatenate((values[:1], means))
+
 class PMDARIMAStrategy(BaseStrategy):
     """
     PMDARIMA-based strategy for automatic ARIMA modeling.
@@ -19,7 +43,10 @@ class PMDARIMAStrategy(BaseStrategy):
     - Limited parameter search space
     - Parallel execution when possible
     - Quick ADF test for differencing
-    - Memory caching for repeated patterns
+    - Order caching for repeated patterns: series whose mean, std and p95 agree to
+      cache_key_significant_digits (and length to 16 points) reuse the orders
+      auto_arima selected, so only a single ARIMA fit on the series itself is
+      needed instead of the stepwise search
     - LRU cache for time series preparation
     - Early stopping for model selection
     - Downsampling for long series
@@ -29,41 +56,86 @@ class PMDARIMAStrategy(BaseStrategy):
         self.forecast_steps = 12  # 1-hour prediction window
         self.seasonal = True      # Enable seasonal patterns
         self.seasonal_period = 12 # 1-hour seasonality (with 5-min intervals)
-        self._model_cache = {}    # Cache for similar patterns
+        self._order_cache = OrderedDict()  # LRU cache of selected model orders for similar patterns
+        self._order_cache_lock = threading.Lock()  # Containers are processed on several threads
+        self.max_cached_orders = 100  # Model orders kept in the LRU cache
+        self.cache_key_significant_digits = 2  # Precision of the order cache key features
         self.max_series_length = 500  # Maximum length for time series
+        self._index_cache = OrderedDict()  # LRU cache of timestamp indexes, shared by CPU and memory
+        self._index_cache_lock = threading.Lock()
+        self.max_cached_indexes = 32
 
     @lru_cache(maxsize=1000)
     def _get_cache_key(self, stats_tuple: tuple) -> str:
-        """Generate cache key based on series characteristics."""
-        return str(hash(stats_tuple))
+        """Generate cache key based on coarsely bucketed series characteristics."""
+        mean, std, p95, length, has_nan = stats_tuple
+        digits = self.cache_key_significant_digits
+        return str(hash((
+            _bucket(mean, digits),
+            _bucket(std, digits),
+            _bucket(p95, digits),
+            length // 16,
+            has_nan
+        )))
+
+    def _timestamp_index(self, timestamps: List[float]) -> pd.DatetimeIndex:
+        """
+        Convert timestamps to a DatetimeIndex, reusing the previous conversion of
+        identical timestamps (the CPU and memory series of a container share them).
+        """
+        key = as_float_array(timestamps).tobytes()
+        with self._index_cache_lock:
+            index = self._index_cache.get(key)
+            if index is not None:
+                self._index_cache.move_to_end(key)
+                return index
+        
+        index = pd.to_datetime(timestamps, unit='s').rename('timestamp')
+        with self._index_cache_lock:
+            self._index_cache[key] = index
+            if len(self._index_cache) > self.max_cached_indexes:
+                self._index_cache.popitem(last=False)
+        return index
 
     def _prepare_time_series(self, samples: List[float], timestamps: List[float]) -> pd.Series:
         """Prepare time series data for ARIMA modeling with downsampling."""
-        df = pd.DataFrame({
-            'timestamp': pd.to_datetime(timestamps, unit='s'),
-            'value': samples
-        })
-        df.set_index('timestamp', inplace=True)
+        values = as_float_array(samples)
+        index = self._timestamp_index(timestamps)
 
         # Downsample if series is too long
-        if len(df) > self.max_series_length:
+        if len(values) > self.max_series_length:
             # Calculate appropriate frequency to get desired length
-            freq = int(len(df) / self.max_series_length)
-            df = df.rolling(window=freq, min_periods=1).mean().iloc[::freq]
-            logger.debug(f"Downsampled series from {len(samples)} to {len(df)} points")
+            freq = int(len(values) / self.max_series_length)
+            values = _downsample(values, freq)
+            index = index[::freq]
+            # Formatting arguments are only applied when a sink accepts debug records
+            logger.debug("Downsampled series from {} to {} points", len(samples), len(values))
 
-        return df['value']
+        return pd.Series(values, index=index, name='value')
 
     def _get_series_stats(self, series: pd.Series) -> tuple:
-        """Get statistical features of the series."""
-        # Use faster numpy operations
-        values = series.values
+        """
+        Get statistical features of the series (over its non-NaN values).
+
+        One isnan pass, a mean, one pass for the variance and an O(n) partition
+        for the p95. Excluding NaNs also keeps the key usable for gappy series,
+        since NaN features never compare (or hash) equal.
+        """
+        values = as_float_array(series.to_numpy())
+        missing = np.isnan(values)
+        has_nan = bool(missing.any())
+        observed = values[~missing] if has_nan else values
+        if observed.size == 0:
+            return (math.nan, math.nan, math.nan, len(values), has_nan)
+        
+        mean = observed.mean()
+        deviations = observed - mean
         return (
-            float(np.mean(values)),
-            float(np.std(values)),
-            float(np.percentile(values, 95)),
+            float(mean),
+            float(math.sqrt(np.dot(deviations, deviations) / observed.size)),
+            float(percentile(observed, 95.0)),
             len(values),
-            bool(np.any(np.isnan(values)))
+            has_nan
         )
 
     def _fit_and_predict(self, series: pd.Series) -> tuple[float, float]:
@@ -73,9 +145,24 @@ class PMDARIMAStrategy(BaseStrategy):
             stats = self._get_series_stats(series)
             cache_key = self._get_cache_key(stats)
             
-            if cache_key in self._model_cache:
-                model = self._model_cache[cache_key]
-                logger.debug("Using cached model")
+            with self._order_cache_lock:
+                orders = self._order_cache.get(cache_key)
+                if orders is not None:
+                    self._order_cache.move_to_end(cache_key)
+            
+            if orders is not None:
+                # Similar series only share the model structure; the model itself
+                # is always fitted on this series, since the forecast continues it
+                logger.debug("Using cached model orders")
+                order, seasonal_order, with_intercept = orders
+                model = ARIMA(
+                    order=order,
+                    seasonal_order=seasonal_order,
+                    with_intercept=with_intercept,
+                    method='lbfgs',
+                    maxiter=10,
+                    suppress_warnings=True
+                ).fit(series)
             else:
                 # Quick differencing test with early stopping
                 n_diffs = min(ndiffs(series, alpha=0.05, test='adf', max_d=2), 1)
@@ -106,13 +193,11 @@ class PMDARIMAStrategy(BaseStrategy):
                     max_order=4                  # Limit total parameters
                 )
                 
-                # Cache the model
-                self._model_cache[cache_key] = model
-                
-                # Limit cache size with LRU policy
-                if len(self._model_cache) > 100:
-                    oldest_key = min(self._model_cache.keys(), key=lambda k: self._model_cache[k].fit_time_)
-                    self._model_cache.pop(oldest_key)
+                # Cache the selected orders, evicting the least recently used entry in O(1)
+                with self._order_cache_lock:
+                    self._order_cache[cache_key] = (model.order, model.seasonal_order, model.with_intercept)
+                    if len(self._order_cache) > self.max_cached_orders:
+                        self._order_cache.popitem(last=False)
             
             # Make prediction with confidence interval
             forecast, conf_int = model.predict(
@@ -128,7 +213,7 @@ class PMDARIMAStrategy(BaseStrategy):
             return None, None
 
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples or not timestamps:
+        if not self._has_samples(cpu_samples) or not self._has_samples(timestamps):
             return self.config.min_cpu_cores
             
         try:
@@ -152,7 +237,7 @@ class PMDARIMAStrategy(BaseStrategy):
             return max(np.percentile(cpu_samples, 95) * 1.1, self.config.min_cpu_cores)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples or not timestamps:
+        if not self._has_samples(memory_samples) or not self._has_samples(timestamps):
             return self.config.min_memory_bytes
             
         try:
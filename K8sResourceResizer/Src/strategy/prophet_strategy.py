@@ -1,7 +1,11 @@
+import hashlib
 import numpy as np
 import pandas as pd
+import threading
+from collections import OrderedDict
 from typing import List, Optional
 from .base_strategy import BaseStrategy
+from ._kernels import as_float_array, percentile
 from prophet import Prophet
 from loguru import logger
 
@@ -20,7 +24,23 @@ class ProphetStrategy(BaseStrategy):
     def __init__(self, config):
         super().__init__(config)
         self.forecast_steps = 12  # 1-hour prediction window
-        self._model_cache = {}    # Cache for similar patterns
+        self._model_cache = OrderedDict()  # LRU cache of forecasts by sample fingerprint
+        self._model_cache_lock = threading.Lock()  # Containers are processed on several threads
+        self.max_cached_forecasts = 256  # Forecasts kept in the LRU cache
+        self._future_cache = OrderedDict()  # Prediction frames by last training timestamp
+        self._future_cache_lock = threading.Lock()
+        self.max_cached_futures = 32  # Prediction frames kept in the LRU cache
+        
+    def _fingerprint(self, samples: List[float], timestamps: List[float]) -> bytes:
+        """
+        Digest of the exact samples and timestamps. The cache holds final forecasts,
+        so rounded summary statistics would hand one series another's forecast
+        (CPU series in particular differ well below a fixed number of decimals).
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(as_float_array(samples).tobytes())
+        digest.update(as_float_array(timestamps).tobytes())
+        return digest.digest()
         
     def _prepare_prophet_data(self, samples: List[float], timestamps: List[float]) -> pd.DataFrame:
         """Prepare data in Prophet's required format."""
@@ -29,13 +49,55 @@ class ProphetStrategy(BaseStrategy):
             'y': samples
         })
         
+    def _is_business_hour(self, ds: pd.Series) -> np.ndarray:
+        """Business hours condition of Prophet's ds column, using the precomputed business day table."""
+        hour = ds.dt.hour.to_numpy()
+        return (
+            (hour >= self.config.business_hours_start) &
+            (hour < self.config.business_hours_end) &
+            self._business_day_mask[ds.dt.dayofweek.to_numpy()]
+        )
+        
+    def _future_frame(self, last_date: pd.Timestamp) -> pd.DataFrame:
+        """
+        Prediction frame of the forecast window after last_date, with its business hours
+        condition; the same as model.make_future_dataframe(include_history=False).
+
+        The frame only depends on the last training timestamp, so it is built once and
+        shared, e.g. by the CPU and memory forecasts of a container. Prophet copies the
+        frame in predict(), so sharing it is safe.
+        """
+        with self._future_cache_lock:
+            future = self._future_cache.get(last_date)
+            if future is not None:
+                self._future_cache.move_to_end(last_date)
+                return future
+        
+        dates = pd.date_range(start=last_date, periods=self.forecast_steps + 1, freq='5min')
+        future = pd.DataFrame({'ds': dates[dates > last_date][:self.forecast_steps]})
+        
+        # Add business hours condition to future
+        future['is_business_hour'] = self._is_business_hour(future['ds'])
+        
+        with self._future_cache_lock:
+            self._future_cache[last_date] = future
+            if len(self._future_cache) > self.max_cached_futures:
+                self._future_cache.popitem(last=False)
+        return future
+        
     def _fit_prophet_model(self, df: pd.DataFrame, multiplicative_seasonality: bool = False) -> Prophet:
         """Fit Prophet model with optimized parameters."""
+        # Seasonalities longer than the history cannot be estimated and only add
+        # Fourier terms to the Stan optimization; every sample covers its 5 minute
+        # step, so e.g. 288 samples make up a full day
+        span_seconds = (df['ds'].max() - df['ds'].min()).total_seconds() + 5 * 60
+        covers_day = span_seconds >= 24 * 3600
+        
         model = Prophet(
             interval_width=0.95,           # 95% confidence interval
             growth='linear',               # Linear growth
-            daily_seasonality=True,        # Daily patterns
-            weekly_seasonality=True,       # Weekly patterns
+            daily_seasonality=covers_day,  # Daily patterns
+            weekly_seasonality=span_seconds >= 7 * 24 * 3600,  # Weekly patterns
             yearly_seasonality=False,      # No yearly patterns (not enough data)
             seasonality_mode='multiplicative' if multiplicative_seasonality else 'additive',
             changepoint_prior_scale=0.05,  # More flexible trend changes
@@ -44,20 +106,17 @@ class ProphetStrategy(BaseStrategy):
             n_changepoints=25              # Number of potential changepoints
         )
         
-        # Add business hours seasonality
-        model.add_seasonality(
-            name='business_hours',
-            period=24,
-            fourier_order=5,
-            condition_name='is_business_hour'
-        )
-        
-        # Add business hours condition
-        df['is_business_hour'] = (
-            (df['ds'].dt.hour >= self.config.business_hours_start) &
-            (df['ds'].dt.hour < self.config.business_hours_end) &
-            (df['ds'].dt.dayofweek.isin(self.config.business_days))
-        )
+        if covers_day:
+            # Add business hours seasonality
+            model.add_seasonality(
+                name='business_hours',
+                period=24,
+                fourier_order=5,
+                condition_name='is_business_hour'
+            )
+            
+            # Add business hours condition
+            df['is_business_hour'] = self._is_business_hour(df['ds'])
         
         try:
             model.fit(df)
@@ -66,80 +125,75 @@ class ProphetStrategy(BaseStrategy):
             logger.warning(f"Prophet model fitting failed: {str(e)}")
             return None
             
+    def _forecast_upper_bound(self, samples: List[float], timestamps: List[float], multiplicative_seasonality: bool) -> Optional[float]:
+        """
+        Highest upper bound of the forecast over the prediction window, or None if the
+        model could not be fitted. Forecasts are reused for matching sample patterns,
+        which skips the Stan fit entirely.
+        """
+        cache_key = (self._fingerprint(samples, timestamps), multiplicative_seasonality)
+        with self._model_cache_lock:
+            upper_bound = self._model_cache.get(cache_key)
+            if upper_bound is not None:
+                self._model_cache.move_to_end(cache_key)
+                logger.debug("Using cached forecast")
+                return upper_bound
+        
+        # Prepare data
+        df = self._prepare_prophet_data(samples, timestamps)
+        
+        model = self._fit_prophet_model(df, multiplicative_seasonality=multiplicative_seasonality)
+        if not model:
+            return None
+        
+        # Make prediction on the (shared) future dataframe
+        forecast = model.predict(self._future_frame(df['ds'].max()))
+        upper_bound = forecast['yhat_upper'].max()
+        
+        with self._model_cache_lock:
+            self._model_cache[cache_key] = upper_bound
+            if len(self._model_cache) > self.max_cached_forecasts:
+                self._model_cache.popitem(last=False)
+        return upper_bound
+
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples or not timestamps:
+        if not self._has_samples(cpu_samples) or not self._has_samples(timestamps):
             return self.config.min_cpu_cores
             
+        # Converted once, shared by the forecast and the fallbacks
+        cpu_samples = as_float_array(cpu_samples)
         try:
-            # Prepare data
-            df = self._prepare_prophet_data(cpu_samples, timestamps)
-            
             # Fit model with multiplicative seasonality for CPU
-            model = self._fit_prophet_model(df, multiplicative_seasonality=True)
-            if not model:
-                return max(np.percentile(cpu_samples, 95) * 1.1, self.config.min_cpu_cores)
-            
-            # Make future dataframe for prediction
-            future = model.make_future_dataframe(
-                periods=self.forecast_steps,
-                freq='5min',
-                include_history=False
-            )
-            
-            # Add business hours condition to future
-            future['is_business_hour'] = (
-                (future['ds'].dt.hour >= self.config.business_hours_start) &
-                (future['ds'].dt.hour < self.config.business_hours_end) &
-                (future['ds'].dt.dayofweek.isin(self.config.business_days))
-            )
-            
-            # Make prediction
-            forecast = model.predict(future)
+            upper_bound = self._forecast_upper_bound(cpu_samples, timestamps, multiplicative_seasonality=True)
+            if upper_bound is None:
+                return max(percentile(cpu_samples, 95.0) * 1.1, self.config.min_cpu_cores)
             
             # Use upper bound of the prediction interval
-            recommended = forecast['yhat_upper'].max()
+            recommended = upper_bound
             
             return max(recommended * 1.1, self.config.min_cpu_cores)
             
         except Exception as e:
             logger.warning(f"CPU prediction failed: {str(e)}. Falling back to percentile.")
-            return max(np.percentile(cpu_samples, 95) * 1.1, self.config.min_cpu_cores)
+            return max(percentile(cpu_samples, 95.0) * 1.1, self.config.min_cpu_cores)
             
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples or not timestamps:
+        if not self._has_samples(memory_samples) or not self._has_samples(timestamps):
             return self.config.min_memory_bytes
             
+        # Converted once, shared by the forecast and the fallbacks
+        memory_samples = as_float_array(memory_samples)
         try:
-            # Prepare data
-            df = self._prepare_prophet_data(memory_samples, timestamps)
-            
             # Fit model with additive seasonality for memory
-            model = self._fit_prophet_model(df, multiplicative_seasonality=False)
-            if not model:
-                return max(max(memory_samples) * self.config.memory_buffer, self.config.min_memory_bytes)
-            
-            # Make future dataframe for prediction
-            future = model.make_future_dataframe(
-                periods=self.forecast_steps,
-                freq='5min',
-                include_history=False
-            )
-            
-            # Add business hours condition to future
-            future['is_business_hour'] = (
-                (future['ds'].dt.hour >= self.config.business_hours_start) &
-                (future['ds'].dt.hour < self.config.business_hours_end) &
-                (future['ds'].dt.dayofweek.isin(self.config.business_days))
-            )
-            
-            # Make prediction
-            forecast = model.predict(future)
+            upper_bound = self._forecast_upper_bound(memory_samples, timestamps, multiplicative_seasonality=False)
+            if upper_bound is None:
+                return max(memory_samples.max() * self.config.memory_buffer, self.config.min_memory_bytes)
             
             # Use upper bound of the prediction interval with memory buffer
-            recommended = forecast['yhat_upper'].max() * self.config.memory_buffer
+            recommended = upper_bound * self.config.memory_buffer
             
             return max(recommended, self.config.min_memory_bytes)
             
         except Exception as e:
             logger.warning(f"Memory prediction failed: {str(e)}. Falling back to peak usage.")
-            return max(max(memory_samples) * self.config.memory_buffer, self.config.min_memory_bytes) 
\ No newline at end of file
+            return max(memory_samples.max() * self.config.memory_buffer, self.config.min_memory_bytes) 
\ No newline at end of file
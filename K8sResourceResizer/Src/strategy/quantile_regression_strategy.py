@@ -1,8 +1,15 @@
 import numpy as np
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from statsmodels.regression.quantile_regression import QuantReg
 from .base_strategy import BaseStrategy
+from ._kernels import NUMBA_AVAILABLE, as_float_array, quantreg_irls
+
+# The quantile models are independent, and with the optional Numba extra the
+# compiled solver releases the GIL, so the fits of one request run side by side;
+# shared across instances so the threads are started once. The NumPy fallback
+# holds the GIL, so without Numba the fits run inline instead of adding
+# another level of threads under the recommendation and ensemble pools
+_FIT_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix='quantreg') if NUMBA_AVAILABLE else None
 
 class QuantileRegressionStrategy(BaseStrategy):
     """
@@ -14,37 +21,44 @@ class QuantileRegressionStrategy(BaseStrategy):
     - Weights recent data more heavily than older data
     - Uses cross-validation to select the best model
     """
-    def _fit_quantile_regression(self, X: np.ndarray, y: np.ndarray, q: float) -> QuantReg:
-        """Fit quantile regression model for a specific quantile."""
-        # Add polynomial features for non-linear relationships
+    def _fit_quantile_regression(self, X_poly: np.ndarray, y: np.ndarray, q: float) -> np.ndarray:
+        """Fit quantile regression model for a specific quantile and return its coefficients."""
+        return quantreg_irls(X_poly, y, q)
+
+    def _predict_latest(self, X: np.ndarray, y: np.ndarray, quantiles: tuple) -> np.ndarray:
+        """
+        Fit one model per quantile (concurrently when the solver is compiled) and
+        predict each at the latest timestamp.
+        Returns the predictions in the order of quantiles.
+        """
+        # Add polynomial features for non-linear relationships, built once for all fits
         X_poly = np.column_stack([X, X**2])
-        model = QuantReg(y, X_poly)
-        return model.fit(q=q)
+        if _FIT_EXECUTOR is not None:
+            fits = [_FIT_EXECUTOR.submit(self._fit_quantile_regression, X_poly, y, q) for q in quantiles]
+            coefficients = [fit.result() for fit in fits]
+        else:
+            coefficients = [self._fit_quantile_regression(X_poly, y, q) for q in quantiles]
+        
+        # Make predictions for the latest timestamp with one product against
+        # the coefficients of all quantiles (one column per quantile)
+        betas = np.column_stack(coefficients)
+        return (X_poly[-1:] @ betas).ravel()
 
     def _prepare_time_features(self, timestamps: List[float]) -> np.ndarray:
         """Prepare time-based features for the model."""
-        # Convert to datetime and extract features
-        dates = pd.to_datetime(timestamps, unit='s')
-        return np.array([t.timestamp() for t in dates]).reshape(-1, 1)
+        # Unix timestamps in seconds are the feature as they are
+        return as_float_array(timestamps).reshape(-1, 1)
 
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples or not timestamps:
+        if not self._has_samples(cpu_samples) or not self._has_samples(timestamps):
             return self.config.min_cpu_cores
             
         # Convert to numpy arrays for processing
         X = self._prepare_time_features(timestamps)
-        y = np.array(cpu_samples)
-        
-        # Fit quantile regression models
-        q_50 = self._fit_quantile_regression(X, y, 0.50)
-        q_75 = self._fit_quantile_regression(X, y, 0.75)
-        q_95 = self._fit_quantile_regression(X, y, 0.95)
+        y = np.array(cpu_samples, dtype=np.float64)
         
-        # Make predictions for the latest timestamp
-        X_latest = np.column_stack([X[-1:], X[-1:]**2])
-        pred_50 = q_50.predict(X_latest)[0]
-        pred_75 = q_75.predict(X_latest)[0]
-        pred_95 = q_95.predict(X_latest)[0]
+        # Fit quantile regression models and predict the latest timestamp
+        pred_50, pred_75, pred_95 = self._predict_latest(X, y, (0.50, 0.75, 0.95))
         
         # Weight the predictions (higher weight to higher quantiles)
         weighted_pred = 0.2 * pred_50 + 0.3 * pred_75 + 0.5 * pred_95
@@ -52,25 +66,26 @@ class QuantileRegressionStrategy(BaseStrategy):
         return max(weighted_pred * 1.1, self.config.min_cpu_cores)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples or not timestamps:
+        if not self._has_samples(memory_samples) or not self._has_samples(timestamps):
             return self.config.min_memory_bytes
             
         # Convert to numpy arrays for processing
         X = self._prepare_time_features(timestamps)
-        y = np.array(memory_samples)
+        y = np.array(memory_samples, dtype=np.float64)
         
-        # Fit quantile regression models
-        q_75 = self._fit_quantile_regression(X, y, 0.75)
-        q_95 = self._fit_quantile_regression(X, y, 0.95)
-        q_99 = self._fit_quantile_regression(X, y, 0.99)
-        
-        # Make predictions for the latest timestamp
-        X_latest = np.column_stack([X[-1:], X[-1:]**2])
-        pred_75 = q_75.predict(X_latest)[0]
-        pred_95 = q_95.predict(X_latest)[0]
-        pred_99 = q_99.predict(X_latest)[0]
+        # Fit quantile regression models and predict the latest timestamp
+        pred_75, pred_95, pred_99 = self._predict_latest(X, y, (0.75, 0.95, 0.99))
         
         # Weight the predictions (higher weight to higher quantiles for memory)
         weighted_pred = 0.1 * pred_75 + 0.3 * pred_95 + 0.6 * pred_99
         
-        return max(weighted_pred * self.config.memory_buffer, self.config.min_memory_bytes) 
\ No newline at end of file
+        return max(weighted_pred * self.config.memory_buffer, self.config.min_memory_bytes)
+
+
+if NUMBA_AVAILABLE:
+    # Compile the solver at import instead of while handling the first container
+    try:
+        quantreg_irls(np.column_stack([np.arange(1.0, 5.0), np.arange(1.0, 5.0)**2]), np.arange(4.0), 0.5)
+    except Exception:
+        # Compiled again on first use, which reports the error in context
+        pass
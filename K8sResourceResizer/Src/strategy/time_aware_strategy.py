@@ -1,7 +1,6 @@
-import numpy as np
-import pandas as pd
 from typing import List, Optional, Dict
 from .base_strategy import BaseStrategy
+from ._kernels import as_float_array, local_hour_and_weekday, mem_stats
 
 class TimeAwareStrategy(BaseStrategy):
     """
@@ -16,7 +15,7 @@ class TimeAwareStrategy(BaseStrategy):
     """
     
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples or not timestamps:
+        if not self._has_samples(cpu_samples) or not self._has_samples(timestamps):
             return self.config.min_cpu_cores
             
         patterns = self._analyze_time_patterns(cpu_samples, timestamps)
@@ -33,7 +32,7 @@ class TimeAwareStrategy(BaseStrategy):
         return max(recommendation, self.config.min_cpu_cores)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples or not timestamps:
+        if not self._has_samples(memory_samples) or not self._has_samples(timestamps):
             return self.config.min_memory_bytes
             
         patterns = self._analyze_time_patterns(memory_samples, timestamps)
@@ -57,44 +56,38 @@ class TimeAwareStrategy(BaseStrategy):
         Returns:
             Dict containing various time-based metrics
         """
-        df = pd.DataFrame({
-            'timestamp': pd.to_datetime(timestamps, unit='s'),
-            'value': samples
-        })
+        values = as_float_array(samples)
         
         # Convert timestamps to local time for accurate business hours
-        df['timestamp'] = df['timestamp'].dt.tz_localize('UTC').dt.tz_convert('Europe/Berlin')
-        df['hour'] = df['timestamp'].dt.hour
-        df['day'] = df['timestamp'].dt.dayofweek
+        hour, day = local_hour_and_weekday(timestamps, 'Europe/Berlin')
 
-        # Filter business hours with more precise time handling
-        business_hours = df[
-            (df['hour'] >= self.config.business_hours_start) & 
-            (df['hour'] < self.config.business_hours_end) & 
-            (df['day'].isin(self.config.business_days))
-        ]
+        # Filter business hours with more precise time handling; the business day
+        # lookup table is precomputed, so no set is built per call
+        in_business_hours = (
+            (hour >= self.config.business_hours_start) & 
+            (hour < self.config.business_hours_end) & 
+            self._business_day_mask[day]
+        )
+        business_hours = values[in_business_hours]
+        non_business = values[~in_business_hours]
         
-        non_business = df[~(
-            (df['hour'] >= self.config.business_hours_start) & 
-            (df['hour'] < self.config.business_hours_end) & 
-            (df['day'].isin(self.config.business_days))
-        )]
-        
-        # Calculate metrics with safeguards for empty dataframes
-        business_mean = business_hours['value'].mean() if not business_hours.empty else 0
-        non_business_mean = non_business['value'].mean() if not non_business.empty else 0
-        overall_mean = df['value'].mean() if not df.empty else 0
+        # Calculate metrics with safeguards for empty arrays; peak and p95 of
+        # each split come from a single partition
+        business_mean = business_hours.mean() if business_hours.size else 0
+        non_business_mean = non_business.mean() if non_business.size else 0
+        overall_mean = values.mean() if values.size else 0
+        business_peak, business_p95 = mem_stats(business_hours) if business_hours.size else (0, 0)
+        overall_peak, overall_p95 = mem_stats(values) if values.size else (0, 0)
         
         # Calculate the ratio of difference between business and non-business hours
         business_diff_ratio = abs(business_mean - non_business_mean) / overall_mean if overall_mean != 0 else 0
         
         return {
-            'business_hours_p95': np.percentile(business_hours['value'], 95) if not business_hours.empty else 0,
-            'business_hours_peak': business_hours['value'].max() if not business_hours.empty else 0,
-            'non_business_p95': np.percentile(non_business['value'], 95) if not non_business.empty else 0,
-            'overall_p95': np.percentile(df['value'], 95) if not df.empty else 0,
-            'overall_peak': df['value'].max() if not df.empty else 0,
+            'business_hours_p95': business_p95,
+            'business_hours_peak': business_peak,
+            'overall_p95': overall_p95,
+            'overall_peak': overall_peak,
             'business_diff_ratio': business_diff_ratio,
             'business_mean': business_mean,
             'non_business_mean': non_business_mean
-        } 
\ No newline at end of file
+        }
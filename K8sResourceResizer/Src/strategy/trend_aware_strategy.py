@@ -1,7 +1,7 @@
 import numpy as np
-import pandas as pd
 from typing import List, Optional, Dict, Any
 from .base_strategy import BaseStrategy
+from ._kernels import as_float_array, trend_stats
 
 class TrendAwareStrategy(BaseStrategy):
     """
@@ -15,7 +15,7 @@ class TrendAwareStrategy(BaseStrategy):
     - Classifies trends as increasing/decreasing/stable based on threshold
     """
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples or not timestamps:
+        if not self._has_samples(cpu_samples) or not self._has_samples(timestamps):
             return self.config.min_cpu_cores
             
         trend_analysis = self._analyze_trends(cpu_samples, timestamps)
@@ -31,7 +31,7 @@ class TrendAwareStrategy(BaseStrategy):
         return max(base_value * 1.1, self.config.min_cpu_cores)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples or not timestamps:
+        if not self._has_samples(memory_samples) or not self._has_samples(timestamps):
             return self.config.min_memory_bytes
             
         trend_analysis = self._analyze_trends(memory_samples, timestamps)
@@ -47,30 +47,18 @@ class TrendAwareStrategy(BaseStrategy):
         return max(base_value * self.config.memory_buffer, self.config.min_memory_bytes)
 
     def _analyze_trends(self, samples: List[float], timestamps: Optional[List[float]] = None) -> Dict[str, Any]:
-        if len(samples) < 2 or not timestamps:
+        if len(samples) < 2 or not self._has_samples(timestamps):
             return {'trend': 'stable', 'growth_rate': 0, 'volatility': 0}
             
-        # Create time series
-        df = pd.DataFrame({
-            'timestamp': pd.to_datetime(timestamps, unit='s'),
-            'value': samples
-        })
-        
-        # Calculate trend using more sophisticated method
-        # Use rolling average to smooth out noise
-        df['rolling_avg'] = df['value'].rolling(window=6, min_periods=1).mean()
-        
-        # Calculate overall trend
-        x = np.arange(len(df))
-        y = df['rolling_avg'].values
-        slope, intercept = np.polyfit(x, y, 1)
+        # Trend of the rolling average (window of 6 smooths out noise), mean and
+        # standard deviation from a single kernel call
+        slope, mean_value, std = trend_stats(as_float_array(samples), 6)
         
         # Calculate growth rate relative to the mean
-        mean_value = df['value'].mean()
-        growth_rate = (slope * len(df)) / mean_value if mean_value != 0 else 0
+        growth_rate = (slope * len(samples)) / mean_value if mean_value != 0 else 0
         
         # Calculate volatility
-        volatility = df['value'].std() / mean_value if mean_value != 0 else 0
+        volatility = std / mean_value if mean_value != 0 else 0
         
         # Determine trend type
         if volatility > self.config.high_variance_threshold:
@@ -1,7 +1,7 @@
 import numpy as np
-import pandas as pd
 from typing import List, Optional
 from .base_strategy import BaseStrategy
+from ._kernels import as_float_array, workload_stats
 
 class WorkloadAwareStrategy(BaseStrategy):
     """
@@ -15,7 +15,7 @@ class WorkloadAwareStrategy(BaseStrategy):
     - Adapts recommendations based on workload classification
     """
     def calculate_cpu_request(self, cpu_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not cpu_samples:
+        if not self._has_samples(cpu_samples):
             return self.config.min_cpu_cores
             
         workload_type = self._detect_workload_type(cpu_samples, timestamps)
@@ -31,7 +31,7 @@ class WorkloadAwareStrategy(BaseStrategy):
             return max(np.percentile(cpu_samples, 90) * 1.1, self.config.min_cpu_cores)
 
     def calculate_memory_request(self, memory_samples: List[float], timestamps: Optional[List[float]] = None) -> float:
-        if not memory_samples:
+        if not self._has_samples(memory_samples):
             return self.config.min_memory_bytes
             
         workload_type = self._detect_workload_type(memory_samples, timestamps)
@@ -48,27 +48,12 @@ class WorkloadAwareStrategy(BaseStrategy):
             return max(peak * self.config.memory_buffer, self.config.min_memory_bytes)
 
     def _detect_workload_type(self, samples: List[float], timestamps: Optional[List[float]] = None) -> str:
-        if not samples:
+        if not self._has_samples(samples):
             return 'stable'
             
-        # Create time series for better analysis
-        if timestamps:
-            df = pd.DataFrame({
-                'timestamp': pd.to_datetime(timestamps, unit='s'),
-                'value': samples
-            })
-            # Calculate rolling statistics
-            df['rolling_mean'] = df['value'].rolling(window=6, min_periods=1).mean()
-            df['rolling_std'] = df['value'].rolling(window=6, min_periods=1).std()
-            
-            # Calculate various metrics
-            mean = df['rolling_mean'].mean()
-            std = df['rolling_std'].mean()
-            peak_to_mean = df['value'].max() / mean if mean != 0 else 0
-            cv = std / mean if mean != 0 else 0  # coefficient of variation
-            
-            # Detect sudden spikes
-            spikes = df[df['value'] > (mean + 2 * std)].shape[0] / len(df)
+        # Rolling statistics (window of 6) and spikes from one call of the compiled kernel
+        if self._has_samples(timestamps):
+            cv, spikes = workload_stats(as_float_array(samples), 6)
             
             # Classify based on multiple factors
             if cv > self.config.high_variance_threshold or spikes > 0.1:
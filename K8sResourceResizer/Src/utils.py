@@ -16,6 +16,15 @@ from logger import logger
 from functools import wraps
 import re
 
+# Duration strings accepted by parse_duration and the hours per unit
+_DURATION_PATTERN = re.compile(r'^(\d+)(h|d|w|yr)$')
+_DURATION_MULTIPLIERS = {
+    'h': 1,
+    'd': 24,
+    'w': 24 * 7,
+    'yr': 24 * 365
+}
+
 def ensure_directory_exists(path):
     """
     Ensure that the directory exists, creating it if necessary.
@@ -23,9 +32,13 @@ def ensure_directory_exists(path):
     Args:
         path (str): Directory path.
     """
-    if not os.path.exists(path):
-        logger.info(f"Creating directory: {path}")
+    # Attempt the mkdir directly instead of checking first, which costs an
+    # extra stat and races with concurrent creators
+    try:
         os.makedirs(path)
+    except FileExistsError:
+        return
+    logger.info(f"Created directory: {path}")
 
 def parse_duration(duration_str: str) -> int:
     """
@@ -49,8 +62,7 @@ def parse_duration(duration_str: str) -> int:
     if not duration_str:
         return 24  # Default to 24 hours
         
-    pattern = re.compile(r'^(\d+)(h|d|w|yr)$')
-    match = pattern.match(duration_str.lower())
+    match = _DURATION_PATTERN.match(duration_str.lower())
     
     if not match:
         raise ValueError(
@@ -59,17 +71,9 @@ def parse_duration(duration_str: str) -> int:
         )
     
     value, unit = match.groups()
-    value = int(value)
     
     # Convert to hours
-    multipliers = {
-        'h': 1,
-        'd': 24,
-        'w': 24 * 7,
-        'yr': 24 * 365
-    }
-    
-    return value * multipliers[unit]
+    return int(value) * _DURATION_MULTIPLIERS[unit]
 
 def handle_exceptions(func):
     """